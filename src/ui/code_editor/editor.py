@@ -1,5 +1,5 @@
 """Advanced code editor with line numbers and syntax highlighting."""
-from typing import Optional, Dict, Set
+from typing import ClassVar, Optional, Dict, Set, Tuple
 from PyQt6.QtWidgets import (
     QPlainTextEdit, QWidget, QTextEdit, QMenu,
     QMessageBox
@@ -16,6 +16,7 @@ from PyQt6.QtGui import (
 import re
 import chardet
 from ..styles.style_manager import StyleManager
+from ..styles.style_enums import StyleClass
 from .line_numbers import LineNumberArea
 from .syntax import PythonHighlighter
 from .dialogs import FindDialog, ReplaceDialog
@@ -35,6 +36,18 @@ class CodeEditor(QPlainTextEdit):
     cursor_position_changed = pyqtSignal(int, int)
     encoding_changed = pyqtSignal(str)
     
+    # Editor actions: (text, shortcut, slot name)
+    _SHORTCUTS = (
+        ("Find", QKeySequence.StandardKey.Find, "show_find_dialog"),
+        ("Replace", "Ctrl+H", "show_replace_dialog"),
+        ("Zoom In", QKeySequence.StandardKey.ZoomIn, "zoom_in"),
+        ("Zoom Out", QKeySequence.StandardKey.ZoomOut, "zoom_out"),
+    )
+    
+    # Key sequences of _SHORTCUTS, built by the first editor since
+    # standard keys are resolved through the running application
+    _key_sequences: ClassVar[Optional[Tuple[QKeySequence, ...]]] = None
+    
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """Initialize the code editor.
         
@@ -88,7 +101,8 @@ class CodeEditor(QPlainTextEdit):
         
     def _apply_styles(self) -> None:
         """Apply default styles to the editor."""
-        self.style_manager.apply_style(self, StyleClass.CODE_EDITOR)
+        # Generated once per theme and shared by every editor
+        self.setStyleSheet(self.style_manager.get_component_style(StyleClass.CODE_EDITOR))
         
     def _connect_signals(self) -> None:
         """Connect editor signals to slots."""
@@ -340,30 +354,16 @@ class CodeEditor(QPlainTextEdit):
         
     def _setup_shortcuts(self) -> None:
         """Set up keyboard shortcuts for editor actions."""
-        # Find/Replace shortcuts
-        find_shortcut = QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_F)
-        replace_shortcut = QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_H)
-        
-        find_action = self.addAction("Find")
-        find_action.setShortcut(find_shortcut)
-        find_action.triggered.connect(self.show_find_dialog)
-        
-        replace_action = self.addAction("Replace")
-        replace_action.setShortcut(replace_shortcut)
-        replace_action.triggered.connect(self.show_replace_dialog)
-        
-        # Zoom shortcuts
-        zoom_in_shortcut = QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_Plus)
-        zoom_out_shortcut = QKeySequence(Qt.Modifier.CTRL | Qt.Key.Key_Minus)
-        
-        zoom_in_action = self.addAction("Zoom In")
-        zoom_in_action.setShortcut(zoom_in_shortcut)
-        zoom_in_action.triggered.connect(self.zoom_in)
-        
-        zoom_out_action = self.addAction("Zoom Out")
-        zoom_out_action.setShortcut(zoom_out_shortcut)
-        zoom_out_action.triggered.connect(self.zoom_out)
-        
+        if CodeEditor._key_sequences is None:
+            CodeEditor._key_sequences = tuple(
+                QKeySequence(shortcut) for _, shortcut, _ in self._SHORTCUTS
+            )
+            
+        for (text, _, slot), sequence in zip(self._SHORTCUTS, CodeEditor._key_sequences):
+            action = self.addAction(text)
+            action.setShortcut(sequence)
+            action.triggered.connect(getattr(self, slot))
+            
     def show_context_menu(self, pos: QPoint) -> None:
         """Show the context menu at the given position.
         
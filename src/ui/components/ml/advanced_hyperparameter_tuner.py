@@ -1,9 +1,9 @@
 """Advanced hyperparameter tuning component with enhanced features and visualization."""
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                            QLabel, QComboBox, QSpinBox, QDoubleSpinBox,
-                           QTableWidget, QTableWidgetItem, QDialog, QCheckBox,
+                           QTableView, QDialog, QCheckBox,
                            QGroupBox, QTabWidget, QTextEdit)
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QAbstractTableModel, QModelIndex, QCoreApplication
 from PyQt6.QtGui import QFont
 import logging
 from typing import Dict, List, Optional, Any, Tuple
@@ -14,7 +14,69 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import json
 from datetime import datetime
+from ....utils.performance import AsyncWorker
 
+class TrialResultsModel(QAbstractTableModel):
+    """Table model of finished trials stored in a numpy structured array."""
+    
+    HEADERS = ["Trial", "Value", "Learning Rate", "Batch Size", "Dropout Rate"]
+    DTYPE = np.dtype([
+        ('trial', 'i4'), ('value', 'f8'), ('learning_rate', 'f8'),
+        ('batch_size', 'i4'), ('dropout_rate', 'f4')
+    ])
+    # Rows reserved at a time when the array is full
+    GROW_ROWS = 1024
+    # Display format of each column
+    _FORMATS = ("{:d}", "{:.6f}", "{:.6f}", "{:d}", "{:.2f}")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._data = np.empty(0, dtype=self.DTYPE)
+        self._rows = 0
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+        
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        value = self._data[index.row()][index.column()]
+        return self._FORMATS[index.column()].format(value.item())
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+        
+    def append(self, trial: int, value: float, params: Dict[str, Any]):
+        """Append a finished trial as a new row.
+        
+        Args:
+            trial: Trial number
+            value: Objective value of the trial
+            params: Trial parameters
+        """
+        if self._rows == len(self._data):
+            self._data = np.resize(self._data, self._rows + self.GROW_ROWS)
+            
+        self.beginInsertRows(QModelIndex(), self._rows, self._rows)
+        self._data[self._rows] = (
+            trial, value, params['learning_rate'],
+            params['batch_size'], params['dropout_rate']
+        )
+        self._rows += 1
+        self.endInsertRows()
+        
+    def clear(self):
+        """Remove all rows."""
+        self.beginResetModel()
+        self._data = np.empty(0, dtype=self.DTYPE)
+        self._rows = 0
+        self.endResetModel()
+        
 class TuningSettingsDialog(QDialog):
     """Dialog for configuring advanced tuning settings."""
     
@@ -109,12 +171,23 @@ class AdvancedHyperparameterTuner(QWidget):
     tuning_started = pyqtSignal()
     tuning_finished = pyqtSignal(dict)  # Best parameters
     tuning_progress = pyqtSignal(dict)  # Current trial results
+    tuning_stopped = pyqtSignal()  # Tuning ended without results
+    
+    # Trial results handed from the tuning thread to the GUI thread
+    _trial_completed = pyqtSignal(dict, dict)  # Result, progress
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
         self._setup_ui()
         self._initialize_state()
+        self._worker = None
+        self._trial_completed.connect(self._on_trial_completed)
+        
+        # Stop a running study before the application exits
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.cleanup)
         
     def _setup_ui(self):
         """Setup the enhanced UI components."""
@@ -210,11 +283,9 @@ class AdvancedHyperparameterTuner(QWidget):
         results_tab = QWidget()
         results_layout = QVBoxLayout(results_tab)
         
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(5)
-        self.results_table.setHorizontalHeaderLabels([
-            "Trial", "Value", "Learning Rate", "Batch Size", "Dropout Rate"
-        ])
+        self.results_model = TrialResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         results_layout.addWidget(self.results_table)
         
         # Add tabs
@@ -257,6 +328,9 @@ class AdvancedHyperparameterTuner(QWidget):
             'parallel': {'enabled': False, 'n_jobs': 4}
         }
         self.results_data = []
+        # Parameter ranges read when tuning starts: name -> (min, max)
+        self.param_ranges = {}
+        self._n_trials = 0
         
     def _show_advanced_settings(self):
         """Show advanced settings dialog."""
@@ -308,65 +382,126 @@ class AdvancedHyperparameterTuner(QWidget):
         )
         
     def _start_tuning(self):
-        """Start hyperparameter tuning."""
+        """Start hyperparameter tuning on a worker thread.
+        
+        Widget values are read here, on the GUI thread. Trials only see
+        that snapshot and report back through queued signals, so the
+        interface stays responsive while models train.
+        """
+        if self._worker is not None:
+            return
+            
         try:
             self.start_btn.setEnabled(False)
             self.stop_btn.setEnabled(True)
             self.export_btn.setEnabled(False)
             self._stop_requested = False
             self.results_data = []
-            self.results_table.setRowCount(0)
+            self.results_model.clear()
+            self.param_ranges = {
+                'learning_rate': (self.lr_min.value(), self.lr_max.value()),
+                'batch_size': (self.batch_min.value(), self.batch_max.value()),
+                'dropout_rate': (self.dropout_min.value(), self.dropout_max.value())
+            }
+            self._n_trials = self.trials_spin.value()
             
             self._create_study()
             self.tuning_started.emit()
             
             n_jobs = self.advanced_settings['parallel']['n_jobs'] if self.advanced_settings['parallel']['enabled'] else 1
             
-            self.study.optimize(
+            self._worker = AsyncWorker(
+                self.study.optimize,
                 self._objective,
-                n_trials=self.trials_spin.value(),
+                n_trials=self._n_trials,
                 callbacks=[self._trial_callback],
                 n_jobs=n_jobs
             )
+            self._worker.finished.connect(self._on_tuning_done)
+            self._worker.error.connect(self._on_tuning_failed)
+            self._worker.start()
             
-            if not self._stop_requested:
-                self.best_params = self.study.best_params
-                self.tuning_finished.emit(self.best_params)
-                self.export_btn.setEnabled(True)
-                
         except Exception as e:
             self.logger.error(f"Error in hyperparameter tuning: {str(e)}")
-        finally:
-            self.start_btn.setEnabled(True)
-            self.stop_btn.setEnabled(False)
+            self._worker = None
+            self._reset_controls()
+            self.tuning_stopped.emit()
+            
+    def _on_tuning_done(self, _result=None):
+        """Publish the best parameters once the study has finished."""
+        if self._worker is None:
+            return  # Already stopped by cleanup
+        self._release_worker()
+        self._reset_controls()
+        
+        best_params = None
+        if not self._stop_requested:
+            try:
+                best_params = self.study.best_params
+            except ValueError as e:  # No trial completed
+                self.logger.error(f"Error in hyperparameter tuning: {str(e)}")
+                
+        if best_params is None:
+            self.tuning_stopped.emit()
+            return
             
+        self.best_params = best_params
+        self.export_btn.setEnabled(True)
+        self.tuning_finished.emit(best_params)
+        
+    def _on_tuning_failed(self, error: Exception):
+        """Report a study that raised."""
+        if self._worker is None:
+            return  # Already stopped by cleanup
+        self._release_worker()
+        self.logger.error(f"Error in hyperparameter tuning: {str(error)}")
+        self._reset_controls()
+        self.tuning_stopped.emit()
+        
+    def _release_worker(self):
+        """Drop the finished tuning worker."""
+        worker, self._worker = self._worker, None
+        worker.wait()
+        worker.cleanup()
+        
+    def _reset_controls(self):
+        """Re-enable the controls after tuning."""
+        self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        
     def _stop_tuning(self):
         """Stop hyperparameter tuning."""
         self._stop_requested = True
         
+    def cleanup(self):
+        """Stop a running study and wait for its thread to finish.
+        
+        The tuning thread has no parent, so it has to be stopped before
+        the widget goes away; destroying it while running aborts the
+        process. The current trial is allowed to finish.
+        """
+        if self._worker is None:
+            return
+            
+        self._stop_requested = True
+        worker, self._worker = self._worker, None
+        worker.stop()
+        worker.wait()
+        worker.cleanup()
+        self._reset_controls()
+        
     def _objective(self, trial):
-        """Objective function for optimization."""
+        """Objective function for optimization. Runs on the tuning thread."""
         if self._stop_requested:
             raise optuna.exceptions.TrialPruned()
             
+        lr_min, lr_max = self.param_ranges['learning_rate']
+        batch_min, batch_max = self.param_ranges['batch_size']
+        dropout_min, dropout_max = self.param_ranges['dropout_rate']
         params = {
-            'learning_rate': trial.suggest_float(
-                'learning_rate',
-                self.lr_min.value(),
-                self.lr_max.value(),
-                log=True
-            ),
-            'batch_size': trial.suggest_int(
-                'batch_size',
-                self.batch_min.value(),
-                self.batch_max.value(),
-                step=8
-            ),
-            'dropout_rate': trial.suggest_float(
-                'dropout_rate',
-                self.dropout_min.value(),
-                self.dropout_max.value()
-            )
+            'learning_rate': trial.suggest_float('learning_rate', lr_min, lr_max, log=True),
+            'batch_size': trial.suggest_int('batch_size', batch_min, batch_max, step=8),
+            'dropout_rate': trial.suggest_float('dropout_rate', dropout_min, dropout_max)
         }
         
         # This should be connected to the model training
@@ -374,32 +509,39 @@ class AdvancedHyperparameterTuner(QWidget):
         return np.random.random()
         
     def _trial_callback(self, study: optuna.study.Study, trial: optuna.trial.FrozenTrial):
-        """Callback for trial completion."""
+        """Callback for trial completion. Runs on the tuning thread."""
         try:
-            # Store results
+            if self._stop_requested:
+                study.stop()
+                
+            # Pruned trials have no value to report
+            if trial.value is None:
+                return
+                
             result = {
                 'trial': trial.number + 1,
                 'value': trial.value,
                 'params': trial.params
             }
-            self.results_data.append(result)
-            
-            # Update table
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-            self.results_table.setItem(row, 0, QTableWidgetItem(str(trial.number + 1)))
-            self.results_table.setItem(row, 1, QTableWidgetItem(f"{trial.value:.6f}"))
-            self.results_table.setItem(row, 2, QTableWidgetItem(f"{trial.params['learning_rate']:.6f}"))
-            self.results_table.setItem(row, 3, QTableWidgetItem(str(trial.params['batch_size'])))
-            self.results_table.setItem(row, 4, QTableWidgetItem(f"{trial.params['dropout_rate']:.2f}"))
-            
-            # Emit progress
             progress = {
                 'trial': trial.number + 1,
-                'total_trials': self.trials_spin.value(),
+                'total_trials': self._n_trials,
                 'best_value': study.best_value,
                 'params': trial.params
             }
+            self._trial_completed.emit(result, progress)
+            
+        except Exception as e:
+            self.logger.error(f"Error in trial callback: {str(e)}")
+            
+    def _on_trial_completed(self, result: Dict, progress: Dict):
+        """Show a finished trial and forward its progress."""
+        try:
+            self.results_data.append(result)
+            
+            # Update table
+            self.results_model.append(result['trial'], result['value'], result['params'])
+            
             self.tuning_progress.emit(progress)
             
         except Exception as e:
@@ -455,6 +597,6 @@ class AdvancedHyperparameterTuner(QWidget):
             self.start_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
             self.export_btn.setEnabled(False)
-            self.results_table.setRowCount(0)
+            self.results_model.clear()
         except Exception as e:
             self.logger.error(f"Error resetting tuner: {str(e)}")
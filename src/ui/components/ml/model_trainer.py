@@ -1,7 +1,7 @@
 """Model trainer component integrating hyperparameter tuning and experiment tracking."""
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                            QLabel, QComboBox, QProgressBar, QTabWidget)
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QCoreApplication
 import logging
 from typing import Dict, Optional, Any, List
 import torch
@@ -22,9 +22,20 @@ class ModelTrainer(QWidget):
     training_finished = pyqtSignal()
     training_progress = pyqtSignal(dict)  # Epoch metrics
     
+    # Updates from the tuning thread, delivered on the GUI thread
+    _batch_progress = pyqtSignal(int)
+    _experiment_logged = pyqtSignal(dict)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
+        
+        # Connected ahead of the tuner's own hook, so the running trial
+        # sees the stop request instead of training to completion
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.cleanup)
+            
         self._setup_ui()
         self._initialize_state()
         
@@ -88,6 +99,9 @@ class ModelTrainer(QWidget):
         self.tuner.tuning_started.connect(self._on_tuning_started)
         self.tuner.tuning_finished.connect(self._on_tuning_finished)
         self.tuner.tuning_progress.connect(self._on_tuning_progress)
+        self.tuner.tuning_stopped.connect(self._reset_controls)
+        self._batch_progress.connect(self.batch_progress.setValue)
+        self._experiment_logged.connect(self.tracker.add_experiment)
         
     def _initialize_state(self):
         """Initialize internal state."""
@@ -98,10 +112,12 @@ class ModelTrainer(QWidget):
         self.val_loader = None
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self._stop_requested = False
+        # Architecture read when training starts
+        self._model_type = self.model_combo.currentText()
         
     def _create_model(self, params: Dict[str, Any]) -> nn.Module:
         """Create model based on selected architecture and parameters."""
-        model_type = self.model_combo.currentText()
+        model_type = self._model_type
         
         if model_type == "Transformer":
             return TransformerBlock(
@@ -164,7 +180,7 @@ class ModelTrainer(QWidget):
             
             # Update batch progress
             progress = (batch_idx + 1) / len(self.train_loader) * 100
-            self.batch_progress.setValue(int(progress))
+            self._batch_progress.emit(int(progress))
             
         avg_loss = total_loss / len(self.train_loader)
         return {
@@ -202,25 +218,18 @@ class ModelTrainer(QWidget):
         }
         
     def _objective(self, trial):
-        """Objective function for hyperparameter optimization."""
+        """Objective function for hyperparameter optimization.
+        
+        Runs on the tuner's worker thread, so it only reads the settings
+        captured when training started and reports through signals.
+        """
+        lr_min, lr_max = self.tuner.param_ranges['learning_rate']
+        batch_min, batch_max = self.tuner.param_ranges['batch_size']
+        dropout_min, dropout_max = self.tuner.param_ranges['dropout_rate']
         params = {
-            'learning_rate': trial.suggest_float(
-                'learning_rate',
-                self.tuner.lr_min.value(),
-                self.tuner.lr_max.value(),
-                log=True
-            ),
-            'batch_size': trial.suggest_int(
-                'batch_size',
-                self.tuner.batch_min.value(),
-                self.tuner.batch_max.value(),
-                step=8
-            ),
-            'dropout_rate': trial.suggest_float(
-                'dropout_rate',
-                self.tuner.dropout_min.value(),
-                self.tuner.dropout_max.value()
-            )
+            'learning_rate': trial.suggest_float('learning_rate', lr_min, lr_max, log=True),
+            'batch_size': trial.suggest_int('batch_size', batch_min, batch_max, step=8),
+            'dropout_rate': trial.suggest_float('dropout_rate', dropout_min, dropout_max)
         }
         
         # Create model and optimizer
@@ -241,12 +250,12 @@ class ModelTrainer(QWidget):
             
             # Update experiment tracker
             metrics = {**train_metrics, **val_metrics}
-            self.tracker.add_experiment({
+            self._experiment_logged.emit({
                 'name': f"Trial_{trial.number}_Epoch_{epoch}",
                 'parameters': params,
                 'metrics': metrics,
                 'timestamp': datetime.now().isoformat(),
-                'model_type': self.model_combo.currentText()
+                'model_type': self._model_type
             })
             
             # Report value for hyperparameter optimization
@@ -256,11 +265,16 @@ class ModelTrainer(QWidget):
         return best_val_loss
         
     def _start_training(self):
-        """Start model training with hyperparameter tuning."""
+        """Start model training with hyperparameter tuning.
+        
+        Training runs on the tuner's worker thread; the controls are
+        re-enabled when tuning finishes or stops.
+        """
         try:
             self.train_btn.setEnabled(False)
             self.stop_btn.setEnabled(True)
             self._stop_requested = False
+            self._model_type = self.model_combo.currentText()
             
             # Connect the objective function to the tuner
             self.tuner._objective = self._objective
@@ -270,21 +284,31 @@ class ModelTrainer(QWidget):
             
         except Exception as e:
             self.logger.error(f"Error starting training: {str(e)}")
-        finally:
-            self.train_btn.setEnabled(True)
-            self.stop_btn.setEnabled(False)
+            self._reset_controls()
             
+    def _reset_controls(self):
+        """Re-enable the training controls."""
+        self.train_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        
     def _stop_training(self):
         """Stop training."""
         self._stop_requested = True
         self.tuner._stop_tuning()
         
+    def cleanup(self):
+        """Stop a running training run and wait for its thread."""
+        self._stop_requested = True
+        self.tuner.cleanup()
+        self._reset_controls()
+        
     def _on_tuning_started(self):
         """Handle tuning started signal."""
         self.training_started.emit()
         
     def _on_tuning_finished(self, best_params: Dict):
         """Handle tuning finished signal."""
+        self._reset_controls()
         try:
             # Create final model with best parameters
             self.model = self._create_model(best_params).to(self.device)
@@ -295,7 +319,7 @@ class ModelTrainer(QWidget):
                 'parameters': best_params,
                 'metrics': self._validate(),
                 'timestamp': datetime.now().isoformat(),
-                'model_type': self.model_combo.currentText(),
+                'model_type': self._model_type,
                 'is_final': True
             })
             
@@ -4,7 +4,8 @@ from PyQt6.QtWidgets import (
     QToolBar, QLabel, QMenu, QMessageBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QDir
-from PyQt6.QtGui import QAction, QFileSystemModel
+from PyQt6.QtGui import QFileSystemModel
+import functools
 import os
 import shutil
 
@@ -13,6 +14,13 @@ class ResourceViewer(QWidget):
     
     resource_selected = pyqtSignal(str)  # Path to selected resource
     
+    # Context menu entries: (text, handler taking the resource path)
+    _CONTEXT_ACTIONS = (
+        ("Open", "_open_resource"),
+        ("Rename", "_rename_resource"),
+        ("Delete", "_delete_resource"),
+    )
+    
     def __init__(self, parent=None):
         """Initialize resource viewer.
         
@@ -73,24 +81,24 @@ class ResourceViewer(QWidget):
         if not index.isValid():
             return
             
-        path = self.model.filePath(index)
-        
-        menu = QMenu()
-        
-        # Add actions
-        open_action = QAction("Open", self)
-        open_action.triggered.connect(lambda: self._open_resource(path))
-        menu.addAction(open_action)
+        menu = QMenu(self)
+        self._create_context_menu(menu, index)
+        menu.exec(self.tree.viewport().mapToGlobal(position))
+        menu.deleteLater()
         
-        rename_action = QAction("Rename", self)
-        rename_action.triggered.connect(lambda: self._rename_resource(path))
-        menu.addAction(rename_action)
+    def _create_context_menu(self, menu: QMenu, index):
+        """Fill a context menu with the actions for a resource.
         
-        delete_action = QAction("Delete", self)
-        delete_action.triggered.connect(lambda: self._delete_resource(path))
-        menu.addAction(delete_action)
+        Actions are owned by the menu, so they go away with it.
         
-        menu.exec(self.tree.viewport().mapToGlobal(position))
+        Args:
+            menu: Menu to fill
+            index: Model index of the resource
+        """
+        path = self.model.filePath(index)
+        for text, handler in self._CONTEXT_ACTIONS:
+            action = menu.addAction(text)
+            action.triggered.connect(functools.partial(getattr(self, handler), path))
         
     def _on_item_clicked(self, index):
         """Handle item click.
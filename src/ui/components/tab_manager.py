@@ -1,9 +1,55 @@
 """Tab management functionality."""
-from PyQt6.QtWidgets import QTabWidget, QWidget
+from PyQt6.QtWidgets import QTabWidget, QWidget, QMessageBox
+from PyQt6.QtCore import QFileSystemWatcher, QIODevice, QSaveFile, QTimer
+from PyQt6.QtGui import QTextCursor
 from ..code_editor import CodeEditor
+from ...utils.performance import PooledWorker
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Deque, Dict, Iterator, List, Set, Tuple
+from collections import OrderedDict, deque
+import functools
+import hashlib
+import itertools
 import logging
+import os
+import sys
+import weakref
+
+# Number of characters decoded per read while loading a file
+READ_CHUNK_SIZE = 64 * 1024
+
+# Number of decoded chunks inserted into an editor per event-loop turn
+INSERT_CHUNKS_PER_TICK = 16
+
+# Number of files written at the same time by save_all_files
+MAX_CONCURRENT_SAVES = 4
+
+# Number of closed files whose content is kept for a quick reopen
+RECENT_FILES_CACHE_SIZE = 8
+
+# Largest document, in characters, kept after its tab is closed
+MAX_CACHED_FILE_CHARS = 1024 * 1024
+
+# Number of closed editors destroyed per event-loop turn
+DESTROY_EDITORS_PER_TICK = 4
+
+def _canonical_path(file_path) -> str:
+    """Build the key a file is tracked under.
+    
+    Resolves symlinks and case differences so one file never gets two
+    tabs, and interns the result so dict lookups compare by identity.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        Canonical, interned path string
+    """
+    return sys.intern(os.path.normcase(os.path.realpath(os.fspath(file_path))))
+
+def _content_hasher():
+    """Create the hasher used to detect unchanged file content."""
+    return hashlib.blake2b(digest_size=16)
 
 class TabManager(QTabWidget):
     """Manages editor tabs and file handling."""
@@ -11,7 +57,25 @@ class TabManager(QTabWidget):
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.logger = logging.getLogger(__name__)
-        self.open_files: Dict[str, CodeEditor] = {}
+        # Index of open files by canonical path; editors record their own
+        # path in file_path and its canonical form in file_key
+        self.open_files: Dict[str, weakref.ref] = {}
+        self._workers: Set[PooledWorker] = set()
+        
+        # On-disk state of open files, as last read or written by us
+        self._content_hashes: Dict[str, bytes] = {}
+        self._mtimes: Dict[str, float] = {}
+        self._saving: Set[str] = set()
+        self._save_queue: Deque[CodeEditor] = deque()
+        self._queued: Set[str] = set()
+        # Files whose tab closes once their pending save has been written
+        self._close_after_save: Set[str] = set()
+        # Content of recently closed, unmodified files: key -> (text, hash, mtime)
+        self._recent: "OrderedDict[str, Tuple[str, bytes, float]]" = OrderedDict()
+        # Closed editors waiting to be destroyed in small batches
+        self._pending_destroy: Deque[CodeEditor] = deque()
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
         
         self._setup_ui()
         
@@ -20,10 +84,14 @@ class TabManager(QTabWidget):
         self.setTabsClosable(True)
         self.setMovable(True)
         self.setDocumentMode(True)
+        self.tabCloseRequested.connect(self._on_tab_close_requested)
         
     def open_file(self, file_path: Path) -> Optional[CodeEditor]:
         """Open a file in a new tab.
         
+        The tab is added immediately and its content is read on a worker
+        thread; the editor stays read-only until loading finishes.
+        
         Args:
             file_path: Path to the file to open
             
@@ -31,41 +99,153 @@ class TabManager(QTabWidget):
             CodeEditor if file opened successfully, None otherwise
         """
         try:
-            str_path = str(file_path)
+            str_path = _canonical_path(file_path)
             
             # Check if already open
-            if str_path in self.open_files:
-                self.setCurrentWidget(self.open_files[str_path])
-                return self.open_files[str_path]
+            ref = self.open_files.get(str_path)
+            existing = ref() if ref is not None else None
+            if existing is not None:
+                self.setCurrentWidget(existing)
+                return existing
                 
             # Create new editor
             editor = CodeEditor(self)
             editor.file_path = file_path
+            editor.file_key = str_path
             
-            # Load file content
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    editor.setPlainText(f.read())
-            except Exception as e:
-                self.logger.error(f"Error reading file {file_path}: {str(e)}")
-                return None
-                
             # Add to tab widget
-            self.open_files[str_path] = editor
+            self.open_files[str_path] = weakref.ref(editor)
             self.addTab(editor, file_path.name)
             self.setCurrentWidget(editor)
             
+            self._load_file(editor)
             return editor
             
         except Exception as e:
             self.logger.error(f"Error opening file {file_path}: {str(e)}")
             return None
             
+    def _load_file(self, editor: CodeEditor):
+        """Load an editor's file content off the GUI thread.
+        
+        A recently closed file that has not changed on disk is filled
+        from the content kept when its tab was closed.
+        
+        Args:
+            editor: Editor to fill with its file content
+        """
+        editor.setReadOnly(True)
+        cached = self._recent.pop(editor.file_key, None)
+        if cached is not None:
+            text, digest, mtime = cached
+            try:
+                unchanged = os.stat(editor.file_key).st_mtime == mtime
+            except OSError:
+                unchanged = False
+            if unchanged:
+                self._on_file_loaded(editor, ([text], digest, mtime))
+                return
+                
+        self._start_worker(
+            PooledWorker(self._read_file, editor.file_path),
+            functools.partial(self._on_file_loaded, editor),
+            functools.partial(self._on_file_load_failed, editor)
+        )
+        
+    @staticmethod
+    def _read_file(file_path: Path) -> Tuple[List[str], bytes, float]:
+        """Read file content as decoded chunks. Runs on a worker thread.
+        
+        Newlines are normalized while decoding, even when a CRLF pair is
+        split across two reads, and the hash covers the normalized text
+        so it matches what the editor later saves.
+        
+        Returns:
+            Tuple of decoded chunks, content hash and modification time
+        """
+        hasher = _content_hasher()
+        chunks = []
+        with open(file_path, 'r', encoding='utf-8', newline=None) as f:
+            for chunk in iter(functools.partial(f.read, READ_CHUNK_SIZE), ''):
+                hasher.update(chunk.encode('utf-8'))
+                chunks.append(chunk)
+            mtime = Path(file_path).stat().st_mtime
+        return chunks, hasher.digest(), mtime
+        
+    def _on_file_loaded(self, editor: CodeEditor,
+                        result: Tuple[List[str], bytes, float]):
+        """Populate an editor once its file has been read.
+        
+        Args:
+            editor: Editor the content belongs to
+            result: Decoded chunks, content hash and modification time
+        """
+        if not self._is_open(editor):
+            return  # Tab was closed while loading
+            
+        chunks, digest, mtime = result
+        editor.setUndoRedoEnabled(False)
+        editor.clear()
+        pending = iter(chunks)
+        editor.pending_chunks = pending
+        self._insert_chunks(editor, pending, digest, mtime)
+        
+    def _insert_chunks(self, editor: CodeEditor, pending: Iterator[str],
+                       digest: bytes, mtime: float):
+        """Append the next batch of loaded chunks to an editor.
+        
+        Large files are inserted over several event-loop turns, so the
+        UI keeps responding while the document grows.
+        
+        Args:
+            editor: Editor being filled
+            pending: Chunks not inserted yet
+            digest: Content hash of the file
+            mtime: Modification time of the file
+        """
+        if not self._is_open(editor) or getattr(editor, 'pending_chunks', None) is not pending:
+            return  # Tab was closed or a newer load took over
+            
+        batch = list(itertools.islice(pending, INSERT_CHUNKS_PER_TICK))
+        if batch:
+            cursor = QTextCursor(editor.document())
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.beginEditBlock()
+            for chunk in batch:
+                cursor.insertText(chunk)
+            cursor.endEditBlock()
+            
+            if len(batch) == INSERT_CHUNKS_PER_TICK:
+                QTimer.singleShot(0, functools.partial(
+                    self._insert_chunks, editor, pending, digest, mtime
+                ))
+                return
+                
+        editor.pending_chunks = None
+        editor.setUndoRedoEnabled(True)
+        editor.moveCursor(QTextCursor.MoveOperation.Start)
+        editor.document().setModified(False)
+        editor.setReadOnly(False)
+        
+        self._track_file(editor.file_key, digest, mtime)
+        
+    def _on_file_load_failed(self, editor: CodeEditor, error: Exception):
+        """Drop the tab of a file that could not be read.
+        
+        Args:
+            editor: Editor the content belongs to
+            error: Exception raised while reading
+        """
+        self.logger.error(f"Error reading file {editor.file_path}: {str(error)}")
+        index = self.indexOf(editor)
+        if index != -1:
+            self.close_tab(index)
+            
     def save_current_file(self) -> bool:
         """Save the current file.
         
         Returns:
-            bool: True if saved successfully, False otherwise
+            bool: True if saving was started, False otherwise
         """
         editor = self.currentWidget()
         if not isinstance(editor, CodeEditor):
@@ -73,29 +253,275 @@ class TabManager(QTabWidget):
             
         return self._save_file(editor)
         
+    def save_all_files(self) -> int:
+        """Save every modified editor without blocking the GUI thread.
+        
+        Saves are queued and written by at most MAX_CONCURRENT_SAVES
+        workers at a time.
+        
+        Returns:
+            int: Number of files queued for saving
+        """
+        queued = 0
+        for index in range(self.count()):
+            editor = self.widget(index)
+            if self._has_unsaved_changes(editor):
+                queued += self._enqueue_save(editor)
+                
+        self._drain_save_queue()
+        return queued
+        
+    def _enqueue_save(self, editor: CodeEditor) -> bool:
+        """Queue an editor for saving unless it is already queued.
+        
+        Args:
+            editor: Editor widget to save
+            
+        Returns:
+            bool: True if the editor was added to the queue
+        """
+        if editor.file_key in self._queued:
+            return False
+        self._save_queue.append(editor)
+        self._queued.add(editor.file_key)
+        return True
+        
+    def _drain_save_queue(self):
+        """Start queued saves while there are free save slots.
+        
+        A file whose previous save is still being written stays queued,
+        so two writes of one file never race; it is started once that
+        save completes.
+        """
+        waiting = []
+        while self._save_queue and len(self._saving) < MAX_CONCURRENT_SAVES:
+            editor = self._save_queue.popleft()
+            if editor.file_key in self._saving:
+                waiting.append(editor)
+                continue
+            self._queued.discard(editor.file_key)
+            if self._is_open(editor):
+                self._save_file(editor)
+        self._save_queue.extendleft(reversed(waiting))
+                
     def _save_file(self, editor: CodeEditor) -> bool:
-        """Save the content of a code editor.
+        """Save the content of a code editor on a worker thread.
         
         Args:
             editor: Editor widget to save
             
         Returns:
-            bool: True if saved successfully, False otherwise
+            bool: True if saving was started, False otherwise
         """
         try:
-            if not editor.file_path:
+            if not editor.file_path or self._is_loading(editor):
                 return False
                 
-            with open(editor.file_path, 'w', encoding='utf-8') as f:
-                f.write(editor.toPlainText())
-                
-            editor.document().setModified(False)
+            # Qt text access has to happen on the GUI thread
+            str_path = editor.file_key
+            if str_path in self._saving:
+                # Written after the running save of this file completes
+                self._enqueue_save(editor)
+                return True
+            content = editor.toPlainText()
+            self._saving.add(str_path)
+            self._start_worker(
+                PooledWorker(
+                    self._write_file, editor.file_path, content,
+                    self._content_hashes.get(str_path), self._mtimes.get(str_path)
+                ),
+                functools.partial(self._on_file_saved, editor),
+                functools.partial(self._on_file_save_failed, editor)
+            )
             return True
             
         except Exception as e:
+            self._saving.discard(editor.file_key)
             self.logger.error(f"Error saving file {editor.file_path}: {str(e)}")
             return False
             
+    @staticmethod
+    def _write_file(file_path: Path, content: str,
+                    known_hash: Optional[bytes] = None,
+                    known_mtime: Optional[float] = None) -> Tuple[bytes, float]:
+        """Write file content. Runs on a worker thread.
+        
+        The write is skipped when the content matches what was last read
+        or written and the file has not been touched since. Otherwise the
+        content goes through QSaveFile, so the file on disk is replaced
+        atomically and never left half written.
+        
+        Returns:
+            Tuple of content hash and modification time after saving
+        """
+        data = content.encode('utf-8')
+        hasher = _content_hasher()
+        hasher.update(data)
+        digest = hasher.digest()
+        
+        path = Path(file_path)
+        if digest == known_hash:
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                mtime = None
+            if mtime is not None and mtime == known_mtime:
+                return digest, mtime
+                
+        save_file = QSaveFile(str(path))
+        if not save_file.open(QIODevice.OpenModeFlag.WriteOnly):
+            raise OSError(save_file.errorString())
+        save_file.write(data)
+        if not save_file.commit():
+            raise OSError(save_file.errorString())
+        return digest, path.stat().st_mtime
+        
+    def _on_file_saved(self, editor: CodeEditor, result: Tuple[bytes, float]):
+        """Mark an editor as unmodified after a successful save."""
+        str_path = editor.file_key
+        self._saving.discard(str_path)
+        if self._is_open(editor):
+            self._track_file(str_path, *result)
+            editor.document().setModified(False)
+        self._drain_save_queue()
+        
+        # Close a tab saved by close_all_tabs once its last write is done
+        if (str_path in self._close_after_save
+                and str_path not in self._saving and str_path not in self._queued):
+            self._close_after_save.discard(str_path)
+            if self._is_open(editor):
+                self.close_tab(self.indexOf(editor))
+            
+    def _on_file_save_failed(self, editor: CodeEditor, error: Exception):
+        """Log a failed save, warning if the file's tab was waiting to close."""
+        str_path = editor.file_key
+        self._saving.discard(str_path)
+        self.logger.error(f"Error saving file {editor.file_path}: {str(error)}")
+        self._drain_save_queue()
+        
+        if str_path in self._close_after_save:
+            # Keep the tab so the changes can still be saved
+            self._close_after_save.discard(str_path)
+            QMessageBox.warning(
+                self, "Save Failed",
+                f"{Path(editor.file_path).name} could not be saved and was "
+                f"left open:\n{error}"
+            )
+        
+    def _track_file(self, str_path: str, digest: bytes, mtime: float):
+        """Remember a file's on-disk state and watch it for external changes.
+        
+        Args:
+            str_path: File path
+            digest: Content hash
+            mtime: Modification time
+        """
+        self._content_hashes[str_path] = digest
+        self._mtimes[str_path] = mtime
+        # Re-arm the watch: an atomic save replaces the watched file
+        self._watcher.removePath(str_path)
+        self._watcher.addPath(str_path)
+            
+    def _untrack_file(self, str_path: str):
+        """Forget a file's on-disk state and stop watching it."""
+        self._content_hashes.pop(str_path, None)
+        self._mtimes.pop(str_path, None)
+        self._watcher.removePath(str_path)
+        
+    def _on_file_changed(self, str_path: str):
+        """Offer to reload a file that was changed outside the editor.
+        
+        Args:
+            str_path: Path of the changed file
+        """
+        ref = self.open_files.get(str_path)
+        editor = ref() if ref is not None else None
+        if editor is None or str_path in self._saving:
+            return
+            
+        path = Path(str_path)
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return  # Deleted; the open tab keeps its content
+            
+        # Some tools replace files on save, which drops the watch
+        if str_path not in self._watcher.files():
+            self._watcher.addPath(str_path)
+            
+        if mtime == self._mtimes.get(str_path):
+            return  # Our own write
+            
+        self._mtimes[str_path] = mtime
+        answer = QMessageBox.question(
+            self, "File Changed",
+            f"{path.name} was changed on disk. Reload it?"
+        )
+        if answer == QMessageBox.StandardButton.Yes:
+            self._load_file(editor)
+            
+    def _remember_closed(self, editor: CodeEditor):
+        """Keep the content of a closing editor for a quick reopen.
+        
+        Only fully loaded, unmodified documents are kept, since their
+        text matches the file as last read or written.
+        
+        Args:
+            editor: Editor whose tab is being closed
+        """
+        str_path = editor.file_key
+        document = editor.document()
+        if (editor.isReadOnly() or document.isModified()
+                or str_path not in self._content_hashes
+                or document.characterCount() > MAX_CACHED_FILE_CHARS):
+            return
+            
+        self._recent[str_path] = (
+            editor.toPlainText(), self._content_hashes[str_path], self._mtimes[str_path]
+        )
+        self._recent.move_to_end(str_path)
+        while len(self._recent) > RECENT_FILES_CACHE_SIZE:
+            self._recent.popitem(last=False)
+            
+    def _start_worker(self, worker: PooledWorker, on_finished, on_error):
+        """Start a file I/O worker and keep it alive until it completes.
+        
+        Args:
+            worker: Worker to start
+            on_finished: Slot receiving the worker result
+            on_error: Slot receiving the raised exception
+        """
+        release = functools.partial(self._release_worker, worker)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.finished.connect(release)
+        worker.signals.error.connect(on_error)
+        worker.signals.error.connect(release)
+        self._workers.add(worker)
+        worker.start()
+        
+    def _release_worker(self, worker: PooledWorker, *_):
+        """Drop the reference to a completed worker."""
+        self._workers.discard(worker)
+        
+    @staticmethod
+    def _is_loading(editor: CodeEditor) -> bool:
+        """Check whether an editor is still being filled from its file.
+        
+        Editors stay read-only until their content is fully inserted, so
+        their text is incomplete and must not be saved before then.
+        """
+        return editor.isReadOnly() or getattr(editor, 'pending_chunks', None) is not None
+        
+    def _has_unsaved_changes(self, widget: QWidget) -> bool:
+        """Check whether a tab holds a loaded editor with unsaved edits."""
+        return (isinstance(widget, CodeEditor) and not self._is_loading(widget)
+                and widget.document().isModified())
+        
+    def _is_open(self, editor: CodeEditor) -> bool:
+        """Check whether an editor still owns the tab of its file."""
+        ref = self.open_files.get(getattr(editor, 'file_key', None))
+        return ref is not None and ref() is editor
+        
     def close_tab(self, index: int) -> bool:
         """Close a tab.
         
@@ -111,15 +537,114 @@ class TabManager(QTabWidget):
                 return False
                 
             # Remove from open files
-            if str(widget.file_path) in self.open_files:
-                del self.open_files[str(widget.file_path)]
+            if self._is_open(widget):
+                str_path = widget.file_key
+                self._remember_closed(widget)
+                del self.open_files[str_path]
+                self._untrack_file(str_path)
                 
             # Remove tab
             self.removeTab(index)
-            widget.deleteLater()
+            self._destroy_later(widget)
             
             return True
             
         except Exception as e:
             self.logger.error(f"Error closing tab {index}: {str(e)}")
             return False
+            
+    def _on_tab_close_requested(self, index: int):
+        """Close a tab from its close button, asking first if it is unsaved.
+        
+        Args:
+            index: Index of the tab to close
+        """
+        editor = self.widget(index)
+        if not self._has_unsaved_changes(editor):
+            self.close_tab(index)
+            return
+            
+        answer = QMessageBox.question(
+            self, "Unsaved Changes",
+            f"Save changes to {Path(editor.file_path).name} before closing?",
+            QMessageBox.StandardButton.Save
+            | QMessageBox.StandardButton.Discard
+            | QMessageBox.StandardButton.Cancel
+        )
+        if answer == QMessageBox.StandardButton.Save:
+            # The tab closes once the save lands
+            if self._save_file(editor):
+                self._close_after_save.add(editor.file_key)
+        elif answer == QMessageBox.StandardButton.Discard:
+            self.close_tab(index)
+            
+    def close_all_tabs(self) -> bool:
+        """Close every tab.
+        
+        Unsaved editors are collected first and handled with a single
+        prompt. Tabs are then removed from the last one so no index
+        shifts, with repaints suspended until all are gone. Editors being
+        saved stay open until their write succeeds, and remain open with
+        a warning if it fails.
+        
+        Returns:
+            bool: True if all tabs were closed or will close once saved,
+            False otherwise
+        """
+        modified = [
+            editor for editor in map(self.widget, range(self.count()))
+            if self._has_unsaved_changes(editor)
+        ]
+        keep = set()
+        if modified:
+            answer = QMessageBox.question(
+                self, "Unsaved Changes",
+                f"Save changes to {len(modified)} modified file(s) before closing?",
+                QMessageBox.StandardButton.SaveAll
+                | QMessageBox.StandardButton.Discard
+                | QMessageBox.StandardButton.Cancel
+            )
+            if answer == QMessageBox.StandardButton.Cancel:
+                return False
+            if answer == QMessageBox.StandardButton.SaveAll:
+                # Modified tabs stay open; each closes when its save lands
+                keep = {editor.file_key for editor in modified}
+                for editor in modified:
+                    if self._save_file(editor):
+                        self._close_after_save.add(editor.file_key)
+                        
+        self.setUpdatesEnabled(False)
+        try:
+            closed = [
+                self.close_tab(index) for index in reversed(range(self.count()))
+                if getattr(self.widget(index), 'file_key', None) not in keep
+            ]
+        finally:
+            self.setUpdatesEnabled(True)
+        return all(closed) and keep <= self._close_after_save
+        
+    def _destroy_later(self, editor: CodeEditor):
+        """Queue a closed editor for destruction.
+        
+        Destroying many large documents at once stalls the event loop,
+        so editors are released a few per turn instead.
+        
+        Args:
+            editor: Editor whose tab was removed
+        """
+        editor.hide()
+        if not self._pending_destroy:
+            QTimer.singleShot(0, self._drain_destroy)
+        self._pending_destroy.append(editor)
+        
+    def _drain_destroy(self):
+        """Destroy one batch of closed editors."""
+        for _ in range(min(DESTROY_EDITORS_PER_TICK, len(self._pending_destroy))):
+            editor = self._pending_destroy.popleft()
+            # Free the text, undo stack and highlighting state right away;
+            # detaching the highlighter first skips rehighlighting the clear
+            editor.highlighter.setDocument(None)
+            editor.document().clear()
+            editor.deleteLater()
+        if self._pending_destroy:
+            QTimer.singleShot(0, self._drain_destroy)
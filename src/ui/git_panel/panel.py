@@ -113,10 +113,25 @@ class GitPanel(QWidget):
         self.operation_failed.connect(self.show_error)
         
     def setup_auto_refresh(self):
-        """Set up automatic refresh of Git status."""
+        """Set up automatic refresh of Git status.
+        
+        The timer only runs while the panel is visible.
+        """
         self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(30000)  # Refresh every 30 seconds
         self.refresh_timer.timeout.connect(self.refresh_all)
-        self.refresh_timer.start(30000)  # Refresh every 30 seconds
+        
+    def showEvent(self, event):
+        """Refresh views and resume auto refresh when the panel is shown."""
+        super().showEvent(event)
+        if not self.refresh_timer.isActive():
+            self.refresh_all()
+            self.refresh_timer.start()
+            
+    def hideEvent(self, event):
+        """Pause auto refresh while the panel is hidden."""
+        super().hideEvent(event)
+        self.refresh_timer.stop()
         
     @cache_result(ttl=5)  # Cache results for 5 seconds
     def get_repository_status(self) -> Dict:
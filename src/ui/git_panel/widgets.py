@@ -11,6 +11,25 @@ from ...utils.git_manager import GitFile, FileStatus
 from ..styles.style_manager import StyleManager
 from ..styles.style_enums import StyleClass
 
+# Icons shared by all Git widgets, keyed by icon path
+ICONS_PATH = Path(__file__).parent.parent / 'resources' / 'icons'
+_ICON_CACHE: Dict[str, QIcon] = {}
+
+def _icon(name: str) -> QIcon:
+    """Get a Git panel icon, decoding each file only once.
+    
+    Args:
+        name: Icon file name inside the icons directory
+        
+    Returns:
+        Cached QIcon
+    """
+    path = str(ICONS_PATH / name)
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        icon = _ICON_CACHE[path] = QIcon(path)
+    return icon
+
 class GitStatusTree(QTreeWidget):
     """Tree widget for displaying Git status."""
     
@@ -109,26 +128,23 @@ class GitToolbar(QWidget):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         
-        # Get icons path relative to this file's location
-        icons_path = Path(__file__).parent.parent / 'resources' / 'icons'
-        
         # Branch selector
         self.branch_label = QLabel("Branch:")
         self.branch_label.setStyleSheet(
             self.style_manager.get_component_style(StyleClass.LABEL)
         )
         self.branch_button = QPushButton()
-        self.branch_button.setIcon(QIcon(str(icons_path / "git-branch.svg")))
+        self.branch_button.setIcon(_icon("git-branch.svg"))
         self.branch_button.setStyleSheet(
             self.style_manager.get_component_style(StyleClass.BUTTON)
         )
         
         # Git operations
         self.remote_btn = QPushButton("Remotes")
-        self.clone_btn = QPushButton(QIcon(str(icons_path / "git-clone.svg")), "")
-        self.commit_btn = QPushButton(QIcon(str(icons_path / "git-commit.svg")), "")
-        self.push_btn = QPushButton(QIcon(str(icons_path / "git-push.svg")), "")
-        self.pull_btn = QPushButton(QIcon(str(icons_path / "git-pull.svg")), "")
+        self.clone_btn = QPushButton(_icon("git-clone.svg"), "")
+        self.commit_btn = QPushButton(_icon("git-commit.svg"), "")
+        self.push_btn = QPushButton(_icon("git-push.svg"), "")
+        self.pull_btn = QPushButton(_icon("git-pull.svg"), "")
         
         for btn in [
             self.clone_btn, self.commit_btn,
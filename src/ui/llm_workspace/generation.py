@@ -77,16 +77,12 @@ class TextGenerationPanel(QWidget):
         
     def apply_styles(self):
         """Apply theme styles to widgets."""
-        style = self.theme_manager.get_current_theme()
-        self.setStyleSheet(style.get_widget_style("TextGeneration"))
-        
-        for text_edit in [self.input_text, self.output_text]:
-            text_edit.setStyleSheet(style.get_widget_style("TextEdit"))
-            
-        for button in [self.generate_btn, self.stop_btn, self.clear_btn]:
-            button.setStyleSheet(style.get_widget_style("Button"))
-            
-        self.progress_bar.setStyleSheet(style.get_widget_style("ProgressBar"))
+        # One type-scoped sheet on the panel instead of one per child:
+        # a single parse and polish pass covers all widgets
+        AdaptiveStyles.apply_style(self, "\n".join((
+            AdaptiveStyles.get_text_style(self.theme_manager),
+            AdaptiveStyles.get_button_style(self.theme_manager)
+        )))
         
     def start_generation(self):
         """Start text generation process."""
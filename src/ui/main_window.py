@@ -1,31 +1,130 @@
 """Main application window with enhanced lazy loading and caching."""
-from typing import Dict, Optional, Set
-from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QDockWidget, QMenuBar,
-    QStatusBar, QMessageBox, QFileDialog
-)
-from PyQt6.QtCore import Qt, pyqtSignal
+from typing import Callable, Dict, List, Optional
+from PyQt6.QtWidgets import QMainWindow, QWidget, QDockWidget, QFileDialog
+from PyQt6.QtCore import Qt, pyqtSignal, QMetaObject, Q_ARG, QTimer, QProcess, QSize
+from PyQt6.QtGui import QIcon, QPainter
+import functools
 import logging
+import sys
 from pathlib import Path
-from ..utils.lazy_loading import LoadPriority, component_loader
+from ..utils.lazy_loading import LoadPriority, component_loader, lazy_import, preload_modules
+from ..utils.performance import thread_pool
 from ..utils.caching import cache
-from .performance_monitor import get_performance_monitor
 from .project_explorer.explorer import ProjectExplorer
 from .code_editor import CodeEditor
 from .components.output.output_panel import OutputPanel
 from .components.resource.resource_viewer import ResourceViewer
 from .styles.theme_manager import ThemeManager
-from .git_panel import GitPanel
-from .llm_workspace import LLMWorkspace
-from .ml_workspace import MLWorkspace
-from .network_visualizer import NetworkVisualizer
 from .python_console.console_widget import ConsoleWidget
-from .settings.dialog import SettingsDialog
-from .training.visualizer import TrainingVisualizer
+
+# Modules only needed by lazy docks and dialogs, imported on first use
+_git_panel = lazy_import(f"{__package__}.git_panel")
+_llm_workspace = lazy_import(f"{__package__}.llm_workspace")
+_ml_workspace = lazy_import(f"{__package__}.ml_workspace")
+_network_visualizer = lazy_import(f"{__package__}.network_visualizer")
+_training_visualizer = lazy_import(f"{__package__}.training.visualizer")
+_settings_dialog = lazy_import(f"{__package__}.settings.dialog")
+_performance_monitor = lazy_import(f"{__package__}.performance_monitor")
+
+# Lazy modules imported on a worker once the window is up, so the first
+# dock or dialog opened does not pay for the import
+_WARM_MODULES = (_git_panel, _llm_workspace, _ml_workspace, _settings_dialog)
+
+logger = logging.getLogger(__name__)
+
+ICON_SUFFIXES = frozenset({".svg", ".png", ".ico"})
+
+@functools.lru_cache(maxsize=128)
+def _load_icon_cached(icon_dir: str, icon_name: str) -> Optional[QIcon]:
+    """Load an icon file once and share the QIcon between callers.
+    
+    Args:
+        icon_dir: Directory holding the icons
+        icon_name: Icon file name relative to icon_dir
+        
+    Returns:
+        QIcon or None if the icon could not be loaded
+    """
+    path = Path(icon_dir, icon_name)
+    icon_path = str(path)
+    if path.suffix.lower() not in ICON_SUFFIXES or not path.is_file():
+        logger.warning("Icon not found or unsupported: %s", path)
+        return None
+        
+    icon = QIcon(icon_path)
+    if icon.isNull():
+        logger.warning("Failed to load icon: %s", path)
+        return None
+    return icon
+
+class StatusLine(QWidget):
+    """Status bar field showing cursor position and encoding.
+    
+    Both values are drawn with a single drawText call instead of one
+    QLabel per field.
+    """
+    
+    def __init__(self, parent: Optional[QWidget] = None):
+        """Initialize status line.
+        
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self._line = 1
+        self._column = 1
+        self._encoding = "UTF-8"
+        
+    def set_cursor(self, line: int, column: int):
+        """Update the cursor position.
+        
+        Args:
+            line: Cursor line, 1-based
+            column: Cursor column, 1-based
+        """
+        if (line, column) != (self._line, self._column):
+            self._line = line
+            self._column = column
+            self.update()
+            
+    def set_encoding(self, encoding: str):
+        """Update the file encoding.
+        
+        Args:
+            encoding: Encoding name
+        """
+        if encoding != self._encoding:
+            self._encoding = encoding
+            self.updateGeometry()
+            self.update()
+            
+    def _text(self) -> str:
+        """Build the displayed text."""
+        return f"Ln {self._line}, Col {self._column}  |  {self._encoding}"
+        
+    def sizeHint(self) -> QSize:
+        """Size for a typical position with the current encoding."""
+        metrics = self.fontMetrics()
+        sample = f"Ln 99999, Col 999  |  {self._encoding}"
+        return QSize(metrics.horizontalAdvance(sample) + 8, metrics.height())
+        
+    def paintEvent(self, event):
+        """Draw both fields at once."""
+        painter = QPainter(self)
+        painter.drawText(
+            self.rect(),
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+            self._text()
+        )
+        painter.end()
 
 class DockManager:
     """Manages dock widgets with lazy loading."""
     
+    __slots__ = (
+        "main_window", "_docks", "_dock_states", "_widgets", "__weakref__"
+    )
+    
     def __init__(self, main_window: QMainWindow):
         """Initialize dock manager.
         
@@ -35,6 +134,7 @@ class DockManager:
         self.main_window = main_window
         self._docks: Dict[str, QDockWidget] = {}
         self._dock_states: Dict[str, bool] = {}
+        self._widgets: Dict[str, QWidget] = {}
         
         # Register with component loader
         component_loader.register_component(
@@ -75,11 +175,79 @@ class DockManager:
         
         self._docks[name] = dock
         self._dock_states[name] = visible
+        self._widgets[name] = widget
         self.main_window.addDockWidget(area, dock)
         
         if not visible:
             dock.hide()
             
+    def register_lazy_dock(
+        self,
+        name: str,
+        factory: Callable[[], QWidget],
+        title: str,
+        area: Qt.DockWidgetArea,
+        visible: bool = False
+    ):
+        """Register a dock widget whose content is built on first show.
+        
+        The dock starts with an empty placeholder; the real widget is
+        created through ``component_loader`` the first time the dock
+        becomes visible or ``get_widget`` is called.
+        
+        Args:
+            name: Unique dock identifier
+            factory: Zero-argument callable creating the dock widget
+            title: Dock title
+            area: Dock area
+            visible: Initial visibility
+        """
+        component_loader.register_component(
+            f"dock_widget_{name}",
+            factory,
+            priority=LoadPriority.LAZY
+        )
+        self.register_dock(name, QWidget(), title, area, visible)
+        del self._widgets[name]
+        
+        self._docks[name].visibilityChanged.connect(
+            functools.partial(self._on_visibility_changed, name)
+        )
+        
+    def get_widget(self, name: str) -> Optional[QWidget]:
+        """Get the content widget of a dock, building it if needed.
+        
+        Args:
+            name: Dock identifier
+            
+        Returns:
+            Dock content widget or None if not found
+        """
+        if (widget := self._widgets.get(name)) is not None:
+            return widget
+            
+        dock = self._docks.get(name)
+        if dock is None:
+            return None
+            
+        widget = component_loader.get_component(f"dock_widget_{name}")
+        if widget is None:
+            return None
+            
+        self._widgets[name] = widget
+        dock.setWidget(widget)
+        return widget
+        
+    def _on_visibility_changed(self, name: str, visible: bool):
+        """Materialize a lazy dock the first time it is shown.
+        
+        Args:
+            name: Dock identifier
+            visible: Whether the dock became visible
+        """
+        if visible and name not in self._widgets:
+            self.get_widget(name)
+            
     def get_dock(self, name: str) -> Optional[QDockWidget]:
         """Get dock widget by name.
         
@@ -105,6 +273,8 @@ class DockManager:
         """
         if dock := self.get_dock(name):
             dock.show()
+            # A tabified dock may be behind another tab
+            dock.raise_()
             self._dock_states[name] = True
             
     def hide_dock(self, name: str):
@@ -117,6 +287,18 @@ class DockManager:
             dock.hide()
             self._dock_states[name] = False
             
+    def set_dock_visible(self, name: str, visible: bool):
+        """Show or hide a dock widget.
+        
+        Args:
+            name: Dock identifier
+            visible: Whether the dock should be visible
+        """
+        if visible:
+            self.show_dock(name)
+        else:
+            self.hide_dock(name)
+            
     def toggle_dock(self, name: str):
         """Toggle dock visibility.
         
@@ -164,6 +346,8 @@ class DockManager:
 class MenuManager:
     """Manages application menus with lazy loading."""
     
+    __slots__ = ("main_window", "menubar", "_menus", "__weakref__")
+    
     def __init__(self, main_window: QMainWindow):
         """Initialize menu manager.
         
@@ -203,7 +387,8 @@ class MenuManager:
         callback,
         shortcut: str = None,
         checkable: bool = False,
-        checked: bool = False
+        checked: bool = False,
+        icon: Optional[QIcon] = None
     ) -> None:
         """Add action to menu.
         
@@ -215,6 +400,7 @@ class MenuManager:
             shortcut: Optional keyboard shortcut
             checkable: Whether action is checkable
             checked: Initial checked state
+            icon: Optional action icon
         """
         if menu_name not in self._menus:
             return
@@ -224,6 +410,8 @@ class MenuManager:
         
         if shortcut:
             action.setShortcut(shortcut)
+        if icon is not None:
+            action.setIcon(icon)
         if checkable:
             action.setCheckable(True)
             action.setChecked(checked)
@@ -250,6 +438,41 @@ class MainWindow(QMainWindow):
     project_loaded = pyqtSignal(str)  # Project path
     project_closed = pyqtSignal()
     
+    icon_path = Path(__file__).parent / "resources" / "icons"
+    
+    # Post-show initialization, one step per event-loop turn
+    _DEFERRED_STEPS = (
+        "_init_statusbar", "_init_theme", "_warm_imports"
+    )
+    
+    # File menu entries: (action name, text, handler, shortcut)
+    _FILE_ACTIONS = (
+        ("new_project", "New Project...", "_on_new_project", "Ctrl+Shift+N"),
+        ("open_project", "Open Project...", "_on_open_project", "Ctrl+Shift+O"),
+        ("close_project", "Close Project", "_on_close_project", None),
+        ("settings", "Settings...", "_on_settings", "Ctrl+,"),
+        ("exit", "Exit", "close", "Alt+F4"),
+    )
+    
+    # Run menu entries: (action name, text, handler, shortcut, icon)
+    _RUN_ACTIONS = (
+        ("run", "Run File", "run_current_file", "F5", "play.svg"),
+    )
+    
+    # View menu dock toggles, left, bottom, then right: (dock name, text, checked)
+    _DOCK_TOGGLES = (
+        ("project_explorer", "Project Explorer", True),
+        ("resources", "Resource Viewer", True),
+        ("output", "Output Panel", True),
+        ("console", "Python Console", True),
+        ("git", "Git Panel", False),
+        ("llm", "LLM Workspace", False),
+        ("ml", "ML Workspace", False),
+        ("network", "Network Visualizer", False),
+        ("training", "Training Progress", False),
+        ("performance", "Performance Monitor", False),
+    )
+    
     def __init__(self):
         """Initialize main window."""
         super().__init__()
@@ -262,13 +485,14 @@ class MainWindow(QMainWindow):
             size_estimate=20 * 1024 * 1024  # 20MB estimate
         )
         
+        self._post_show_done = False
+        self._run_process: Optional[QProcess] = None
+        
         self._init_window()
         self._init_managers()
         self._init_central_widget()
         self._init_docks()
         self._init_menus()
-        self._init_statusbar()
-        self._init_theme()
         
         # Show window
         self.show()
@@ -289,10 +513,6 @@ class MainWindow(QMainWindow):
         # Initialize project explorer
         self.project_explorer = None  # Will be initialized in _init_docks
         
-        # Connect signals
-        self.project_loaded = pyqtSignal(str)
-        self.project_closed = pyqtSignal()
-        
     def _init_central_widget(self):
         """Initialize central widget."""
         self.code_editor = CodeEditor(self)
@@ -313,44 +533,30 @@ class MainWindow(QMainWindow):
         self.project_explorer.project_loaded.connect(self._on_project_loaded)
         self.project_explorer.project_closed.connect(self._on_project_closed)
         
-        # Git Panel
-        self.git_panel = GitPanel(self)
-        self.dock_manager.register_dock(
+        # Hidden docks are built on first show
+        self.dock_manager.register_lazy_dock(
             "git",
-            self.git_panel,
+            lambda: _git_panel.GitPanel(self),
             "Git",
-            Qt.DockWidgetArea.BottomDockWidgetArea,
-            visible=False
+            Qt.DockWidgetArea.BottomDockWidgetArea
         )
-        
-        # LLM Workspace
-        self.llm_workspace = LLMWorkspace(self)
-        self.dock_manager.register_dock(
+        self.dock_manager.register_lazy_dock(
             "llm",
-            self.llm_workspace,
+            lambda: _llm_workspace.LLMWorkspace(self),
             "LLM Workspace",
-            Qt.DockWidgetArea.RightDockWidgetArea,
-            visible=False
+            Qt.DockWidgetArea.RightDockWidgetArea
         )
-        
-        # ML Workspace
-        self.ml_workspace = MLWorkspace(self)
-        self.dock_manager.register_dock(
+        self.dock_manager.register_lazy_dock(
             "ml",
-            self.ml_workspace,
+            lambda: _ml_workspace.MLWorkspace(self),
             "ML Workspace",
-            Qt.DockWidgetArea.RightDockWidgetArea,
-            visible=False
+            Qt.DockWidgetArea.RightDockWidgetArea
         )
-        
-        # Network Visualizer
-        self.network_visualizer = NetworkVisualizer(self)
-        self.dock_manager.register_dock(
+        self.dock_manager.register_lazy_dock(
             "network",
-            self.network_visualizer,
+            lambda: _network_visualizer.NetworkVisualizer(self),
             "Network Visualizer",
-            Qt.DockWidgetArea.RightDockWidgetArea,
-            visible=False
+            Qt.DockWidgetArea.RightDockWidgetArea
         )
         
         # Output panel
@@ -381,146 +587,140 @@ class MainWindow(QMainWindow):
         )
         
         # Training Visualizer
-        self.training_visualizer = TrainingVisualizer(self)
-        self.dock_manager.register_dock(
+        self.dock_manager.register_lazy_dock(
             "training",
-            self.training_visualizer,
+            lambda: _training_visualizer.TrainingVisualizer(self),
             "Training Progress",
-            Qt.DockWidgetArea.RightDockWidgetArea,
-            visible=False
+            Qt.DockWidgetArea.RightDockWidgetArea
         )
         
         # Performance monitor
-        self.performance_monitor = get_performance_monitor(self)
-        self.dock_manager.register_dock(
+        self.dock_manager.register_lazy_dock(
             "performance",
-            self.performance_monitor,
+            lambda: _performance_monitor.get_performance_monitor(self),
             "Performance",
-            Qt.DockWidgetArea.RightDockWidgetArea,
-            visible=False
+            Qt.DockWidgetArea.RightDockWidgetArea
         )
         
+    @property
+    def git_panel(self) -> QWidget:
+        """Git panel, built on first access."""
+        return self.dock_manager.get_widget("git")
+        
+    @property
+    def llm_workspace(self) -> QWidget:
+        """LLM workspace, built on first access."""
+        return self.dock_manager.get_widget("llm")
+        
+    @property
+    def ml_workspace(self) -> QWidget:
+        """ML workspace, built on first access."""
+        return self.dock_manager.get_widget("ml")
+        
+    @property
+    def network_visualizer(self) -> QWidget:
+        """Network visualizer, built on first access."""
+        return self.dock_manager.get_widget("network")
+        
+    @property
+    def training_visualizer(self) -> QWidget:
+        """Training visualizer, built on first access."""
+        return self.dock_manager.get_widget("training")
+        
+    @property
+    def performance_monitor(self) -> QWidget:
+        """Performance monitor, built on first access."""
+        return self.dock_manager.get_widget("performance")
+        
     def _init_menus(self):
         """Initialize menus."""
         # File menu
         self.menu_manager.create_menu("file", "&File")
-        self.menu_manager.add_action(
-            "file", "new_project",
-            "New Project...",
-            self._on_new_project,
-            "Ctrl+Shift+N"
-        )
-        self.menu_manager.add_action(
-            "file", "open_project",
-            "Open Project...",
-            self._on_open_project,
-            "Ctrl+Shift+O"
-        )
-        self.menu_manager.add_action(
-            "file", "close_project",
-            "Close Project",
-            self._on_close_project
-        )
-        self.menu_manager.add_action(
-            "file", "settings",
-            "Settings...",
-            self._on_settings,
-            "Ctrl+,"
-        )
-        self.menu_manager.add_action(
-            "file", "exit",
-            "Exit",
-            self.close,
-            "Alt+F4"
-        )
-        
+        for action_name, text, handler, shortcut in self._FILE_ACTIONS:
+            self.menu_manager.add_action(
+                "file", action_name, text, getattr(self, handler), shortcut
+            )
+            
+        # Run menu
+        self.menu_manager.create_menu("run", "&Run")
+        for action_name, text, handler, shortcut, icon_name in self._RUN_ACTIONS:
+            self.menu_manager.add_action(
+                "run", action_name, text, getattr(self, handler), shortcut,
+                icon=self._load_icon(icon_name)
+            )
+            
         # View menu
         self.menu_manager.create_menu("view", "&View")
+        for dock_name, text, checked in self._DOCK_TOGGLES:
+            self.menu_manager.add_action(
+                "view", f"toggle_{dock_name}",
+                text,
+                functools.partial(self.dock_manager.set_dock_visible, dock_name),
+                checkable=True,
+                checked=checked
+            )
+            # Keep the check mark in step when a dock is closed or shown
+            # from its own title bar
+            action = self.menu_manager.get_action("view", f"toggle_{dock_name}")
+            self.dock_manager.get_dock(dock_name).visibilityChanged.connect(action.setChecked)
+            
+    def showEvent(self, event):
+        """Schedule deferred initialization on the first show."""
+        super().showEvent(event)
+        if not self._post_show_done:
+            self._post_show_done = True
+            QTimer.singleShot(0, functools.partial(
+                self._run_deferred_steps, list(self._DEFERRED_STEPS)
+            ))
+            
+    def _run_deferred_steps(self, steps: List[str]):
+        """Run the next post-show initialization step.
         
-        # Left dock widgets
-        self.menu_manager.add_action(
-            "view", "toggle_project_explorer",
-            "Project Explorer",
-            lambda: self.dock_manager.toggle_dock("project_explorer"),
-            checkable=True,
-            checked=True
-        )
-        self.menu_manager.add_action(
-            "view", "toggle_resources",
-            "Resource Viewer",
-            lambda: self.dock_manager.toggle_dock("resources"),
-            checkable=True,
-            checked=True
-        )
-        
-        # Bottom dock widgets
-        self.menu_manager.add_action(
-            "view", "toggle_output",
-            "Output Panel",
-            lambda: self.dock_manager.toggle_dock("output"),
-            checkable=True,
-            checked=True
-        )
-        self.menu_manager.add_action(
-            "view", "toggle_console",
-            "Python Console",
-            lambda: self.dock_manager.toggle_dock("console"),
-            checkable=True,
-            checked=True
-        )
-        self.menu_manager.add_action(
-            "view", "toggle_git",
-            "Git Panel",
-            lambda: self.dock_manager.toggle_dock("git"),
-            checkable=True,
-            checked=False
-        )
+        Each step gets its own event-loop turn, so input and paint events
+        are handled in between and the window is ready as soon as the
+        last step finishes.
         
-        # Right dock widgets
-        self.menu_manager.add_action(
-            "view", "toggle_llm",
-            "LLM Workspace",
-            lambda: self.dock_manager.toggle_dock("llm"),
-            checkable=True,
-            checked=False
-        )
-        self.menu_manager.add_action(
-            "view", "toggle_ml",
-            "ML Workspace",
-            lambda: self.dock_manager.toggle_dock("ml"),
-            checkable=True,
-            checked=False
-        )
-        self.menu_manager.add_action(
-            "view", "toggle_network",
-            "Network Visualizer",
-            lambda: self.dock_manager.toggle_dock("network"),
-            checkable=True,
-            checked=False
-        )
-        self.menu_manager.add_action(
-            "view", "toggle_training",
-            "Training Progress",
-            lambda: self.dock_manager.toggle_dock("training"),
-            checkable=True,
-            checked=False
-        )
-        self.menu_manager.add_action(
-            "view", "toggle_performance",
-            "Performance Monitor",
-            lambda: self.dock_manager.toggle_dock("performance"),
-            checkable=True,
-            checked=False
-        )
+        Args:
+            steps: Names of the remaining step methods
+        """
+        step = steps.pop(0)
+        try:
+            getattr(self, step)()
+        except Exception as e:
+            logger.error("Deferred initialization step %s failed: %s", step, e)
+            
+        if steps:
+            QTimer.singleShot(0, functools.partial(self._run_deferred_steps, steps))
+            
+    def _warm_imports(self):
+        """Import lazy dock and dialog modules on a worker thread."""
+        thread_pool.submit("warm_imports", preload_modules, *_WARM_MODULES)
         
     def _init_statusbar(self):
         """Initialize status bar."""
-        self.statusBar().showMessage("Ready")
+        status_bar = self.statusBar()
+        self.status_line = StatusLine(status_bar)
+        status_bar.addPermanentWidget(self.status_line)
+        self.code_editor.cursor_position_changed.connect(self.status_line.set_cursor)
+        self.code_editor.encoding_changed.connect(self.status_line.set_encoding)
+        status_bar.showMessage("Ready")
         
     def _init_theme(self):
         """Initialize theme."""
         self.theme_manager.apply_theme()
         
+    def _load_icon(self, icon_name: str) -> Optional[QIcon]:
+        """Load an icon from the resources directory.
+        
+        Args:
+            icon_name: Icon file name relative to the icons directory
+            
+        Returns:
+            QIcon or None if the icon could not be loaded
+        """
+        # Keyed on the raw name so cache hits do no path work
+        return _load_icon_cached(str(self.icon_path), icon_name)
+        
     def _on_new_project(self):
         """Handle new project action."""
         dialog = QFileDialog(self)
@@ -551,43 +751,149 @@ class MainWindow(QMainWindow):
         Args:
             path: Project path
         """
-        self.setWindowTitle(f"NeuralForge - {path}")
-        self.statusBar().showMessage(f"Project loaded: {path}")
+        self._queue_window_update(
+            f"NeuralForge - {path}",
+            f"Project loaded: {path}"
+        )
         self.project_loaded.emit(path)
         
     def _on_project_closed(self):
         """Handle project closed event."""
-        self.setWindowTitle("NeuralForge")
-        self.statusBar().showMessage("Project closed")
+        self._queue_window_update("NeuralForge", "Project closed")
         self.project_closed.emit()
         
+    def _queue_window_update(self, title: str, message: str):
+        """Queue title and status bar updates for the next event loop pass.
+        
+        Both changes are delivered through queued invocations so Qt can
+        coalesce the resulting repaints into a single paint.
+        
+        Args:
+            title: New window title
+            message: Status bar message
+        """
+        QMetaObject.invokeMethod(
+            self, "setWindowTitle",
+            Qt.ConnectionType.QueuedConnection,
+            Q_ARG(str, title)
+        )
+        QMetaObject.invokeMethod(
+            self.statusBar(), "showMessage",
+            Qt.ConnectionType.QueuedConnection,
+            Q_ARG(str, message)
+        )
+        
+    def run_current_file(self):
+        """Run the current file with the Python interpreter."""
+        self._start_run_process()
+        
+    def _start_run_process(self):
+        """Start the current file in a QProcess and stream its output."""
+        file_path = getattr(self.code_editor, "file_path", None)
+        if not file_path:
+            self.statusBar().showMessage("No file to run", 2000)
+            return
+            
+        if (self._run_process is not None and
+                self._run_process.state() != QProcess.ProcessState.NotRunning):
+            self.statusBar().showMessage("A process is already running", 2000)
+            return
+            
+        file_path = Path(file_path)
+        process = QProcess(self)
+        process.setProgram(sys.executable)
+        process.setArguments([str(file_path)])
+        process.setWorkingDirectory(str(file_path.parent))
+        process.readyReadStandardOutput.connect(self._on_run_output)
+        process.readyReadStandardError.connect(self._on_run_error)
+        process.finished.connect(self._on_run_finished)
+        process.errorOccurred.connect(self._on_run_failed)
+        
+        self._run_process = process
+        self.output_panel.clear()
+        self.output_panel.set_status(f"Running {file_path.name}")
+        process.start()
+        
+    def _on_run_output(self):
+        """Append new process stdout to the output panel."""
+        data = self._run_process.readAllStandardOutput()
+        self.output_panel.append_text(bytes(data).decode(errors="replace"))
+        
+    def _on_run_error(self):
+        """Append new process stderr to the output panel."""
+        data = self._run_process.readAllStandardError()
+        self.output_panel.append_error(bytes(data).decode(errors="replace"))
+        
+    def _on_run_finished(self, exit_code: int, exit_status: QProcess.ExitStatus):
+        """Report the end of a run.
+        
+        Args:
+            exit_code: Process exit code
+            exit_status: Whether the process exited normally
+        """
+        message = f"Finished with exit code {exit_code}"
+        self.output_panel.set_status(message)
+        self.statusBar().showMessage(message, 2000)
+        self._run_process.deleteLater()
+        self._run_process = None
+        
+    def _on_run_failed(self, error: QProcess.ProcessError):
+        """Report a run whose interpreter could not be started.
+        
+        Args:
+            error: Kind of process error
+        """
+        # Other errors are followed by finished, which releases the process
+        if error != QProcess.ProcessError.FailedToStart:
+            return
+            
+        message = f"Failed to start: {self._run_process.errorString()}"
+        self.output_panel.set_status(message)
+        self.statusBar().showMessage(message, 5000)
+        self._run_process.deleteLater()
+        self._run_process = None
+        
     def _on_settings(self):
         """Handle settings action."""
-        dialog = SettingsDialog(self)
+        dialog = _settings_dialog.SettingsDialog(self)
         dialog.exec()
         
     def closeEvent(self, event):
-        """Handle window close event."""
-        # Save window state
-        state = self.dock_manager.save_state()
-        cache.set(
-            "window_state",
-            state,
-            priority=LoadPriority.HIGH
-        )
+        """Handle window close event.
         
-        # Close project
-        self.project_explorer.close_project()
+        The window is hidden before cleanup runs so closing feels
+        immediate.
+        """
+        self.hide()
         
-        # Accept close event
+        # Stop a running script; its finished signal releases it
+        if self._run_process is not None:
+            self._run_process.kill()
+            
+        # Accept first so a failing teardown step cannot keep the window
         event.accept()
+        self._teardown()
+        
+    def _teardown(self):
+        """Save state and release the project after the window closed."""
+        try:
+            # Save window state
+            state = self.dock_manager.save_state()
+            cache.set(
+                "window_state",
+                state,
+                priority=LoadPriority.HIGH
+            )
+            
+            # Close project
+            self.project_explorer.close_project()
+        except Exception as e:
+            logger.error("Error during window teardown: %s", e)
 
-# Create global instance
-main_window = None
-
+@functools.cache
 def get_main_window() -> MainWindow:
-    """Get or create main window instance."""
-    global main_window
-    if main_window is None:
-        main_window = MainWindow()
-    return main_window
+    """Get or create main window instance.
+    
+    Use ``get_main_window.cache_clear()`` to drop the cached instance.
+    """
+    return MainWindow()
@@ -3,7 +3,6 @@ from typing import Optional, Dict, Any
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSplitter
 from PyQt6.QtCore import Qt, pyqtSignal
 import logging
-from ...utils.caching import cache_result
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +22,12 @@ class MLWorkspace(QWidget):
             parent: Parent widget
         """
         super().__init__(parent)
+        self._model_name: Optional[str] = None
+        self._training = False
+        # Bumped by every state change; the cached state is rebuilt only
+        # when its revision is older than this
+        self._state_rev = 0
+        self._state_cache = (None, -1)
         self.setup_ui()
         self.connect_signals()
         
@@ -43,16 +48,48 @@ class MLWorkspace(QWidget):
         
     def connect_signals(self):
         """Connect widget signals."""
-        pass
+        self.model_loaded.connect(self._on_model_loaded)
+        self.training_started.connect(lambda: self._set_training(True))
+        self.training_finished.connect(lambda: self._set_training(False))
+        
+    def _on_model_loaded(self, name: str):
+        """Record the loaded model.
+        
+        Args:
+            name: Name of the loaded model
+        """
+        self._model_name = name
+        self._state_rev += 1
+        
+    def _set_training(self, training: bool):
+        """Record whether training is running.
+        
+        Args:
+            training: Whether training is running
+        """
+        self._training = training
+        self._state_rev += 1
         
-    @cache_result()
     def get_workspace_state(self) -> Dict[str, Any]:
         """Get current workspace state.
         
+        The state is rebuilt only after it has changed.
+        
         Returns:
             Dictionary with workspace state
         """
+        state, rev = self._state_cache
+        if rev == self._state_rev:
+            return state
+            
+        state = self._build_state()
+        self._state_cache = (state, self._state_rev)
+        return state
+        
+    def _build_state(self) -> Dict[str, Any]:
+        """Build the workspace state dictionary."""
         return {
-            # TODO: Add actual state
-            "initialized": True
+            "initialized": True,
+            "model": self._model_name,
+            "training": self._training
         }
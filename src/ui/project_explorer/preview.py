@@ -1,6 +1,8 @@
 """File preview widget for project explorer."""
-from typing import Optional
+from typing import Optional, Set, Tuple
 from pathlib import Path
+import codecs
+import functools
 import mimetypes
 import logging
 from PyQt6.QtWidgets import (
@@ -11,9 +13,13 @@ from PyQt6.QtGui import QPixmap, QImage, QTextCharFormat, QSyntaxHighlighter
 from PyQt6.QtCore import Qt, pyqtSignal
 from ..styles.style_manager import StyleManager
 from ..styles.style_enums import StyleClass
+from ...utils.performance import PooledWorker
 
 logger = logging.getLogger(__name__)
 
+# Largest leading part of a text file read for its preview, in bytes
+PREVIEW_MAX_BYTES = 256 * 1024
+
 class SyntaxHighlighter(QSyntaxHighlighter):
     """Basic syntax highlighter for code preview."""
     
@@ -93,6 +99,7 @@ class FilePreviewWidget(QWidget):
         super().__init__(parent)
         self.style_manager = StyleManager()
         self.current_path: Optional[Path] = None
+        self._workers: Set[PooledWorker] = set()
         self.setup_ui()
         
     def setup_ui(self):
@@ -170,22 +177,81 @@ class FilePreviewWidget(QWidget):
     def show_text_preview(self, path: Path):
         """Show text file preview.
         
+        The file is read on a worker thread and shown once loaded,
+        unless another file was selected in the meantime.
+        
         Args:
             path: Text file path
         """
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            self.text_preview.setPlainText(content)
-            self.scroll_area.setWidget(self.text_preview)
-            self.text_preview.show()
-            self.image_preview.hide()
-            self.preview_ready.emit()
+        worker = PooledWorker(self._read_text_head, path)
+        release = functools.partial(self._release_worker, worker)
+        worker.signals.finished.connect(functools.partial(self._on_text_loaded, path))
+        worker.signals.finished.connect(release)
+        worker.signals.error.connect(functools.partial(self._on_text_load_failed, path))
+        worker.signals.error.connect(release)
+        self._workers.add(worker)
+        worker.start()
+        
+    @staticmethod
+    def _read_text_head(path: Path) -> Tuple[str, bool]:
+        """Read the start of a text file. Runs on a worker thread.
+        
+        Args:
+            path: Text file path
             
-        except UnicodeDecodeError:
+        Returns:
+            Tuple of the decoded text and whether the file was cut off
+        """
+        with open(path, 'rb') as f:
+            data = f.read(PREVIEW_MAX_BYTES + 1)
+        truncated = len(data) > PREVIEW_MAX_BYTES
+        # A multi-byte character split at the limit stays in the decoder
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        return decoder.decode(data[:PREVIEW_MAX_BYTES], final=not truncated), truncated
+        
+    def _on_text_loaded(self, path: Path, result: Tuple[str, bool]):
+        """Fill the text preview with loaded file content.
+        
+        Args:
+            path: File the content was read from
+            result: Decoded text and whether the file was cut off
+        """
+        if path != self.current_path:
+            return  # Another file was selected while loading
+            
+        content, truncated = result
+        if truncated:
+            self.info_label.setText(
+                f"{self.info_label.text()}\n"
+                f"Showing first {self.format_size(PREVIEW_MAX_BYTES)}"
+            )
+            
+        self.text_preview.setPlainText(content)
+        self.scroll_area.setWidget(self.text_preview)
+        self.text_preview.show()
+        self.image_preview.hide()
+        self.preview_ready.emit()
+        
+    def _on_text_load_failed(self, path: Path, error: Exception):
+        """Report a text file that could not be read.
+        
+        Args:
+            path: File that failed to load
+            error: Exception raised while reading
+        """
+        if path != self.current_path:
+            return
+            
+        if isinstance(error, UnicodeDecodeError):
             self.show_error("File is not valid text")
+        else:
+            logger.error(f"Failed to preview file: {str(error)}")
+            self.show_error(f"Failed to preview file: {str(error)}")
             
+    def _release_worker(self, worker: PooledWorker, *_):
+        """Drop the reference to a completed worker."""
+        self._workers.discard(worker)
+        
     def show_image_preview(self, path: Path):
         """Show image file preview.
         
@@ -3,6 +3,7 @@ from typing import Any, Dict, Optional
 from pathlib import Path
 import json
 import logging
+import os
 from PyQt6.QtCore import QObject, pyqtSignal
 
 logger = logging.getLogger(__name__)
@@ -46,18 +47,28 @@ class SettingsManager(QObject):
             if section:
                 # Save specific section
                 if section in self.settings:
-                    file = self.settings_dir / f"{section}.json"
-                    with open(file, 'w') as f:
-                        json.dump(self.settings[section], f, indent=2)
+                    self._write_section(section, self.settings[section])
             else:
                 # Save all sections
                 for section, data in self.settings.items():
-                    file = self.settings_dir / f"{section}.json"
-                    with open(file, 'w') as f:
-                        json.dump(data, f, indent=2)
+                    self._write_section(section, data)
         except Exception as e:
             logger.error(f"Failed to save settings: {str(e)}")
             
+    def _write_section(self, section: str, data: Dict):
+        """Atomically write one settings section to its file.
+        
+        Args:
+            section: Settings section
+            data: Section data to serialize
+        """
+        file = self.settings_dir / f"{section}.json"
+        tmp = file.with_name(file.name + '.tmp')
+        payload = json.dumps(data, indent=2).encode('utf-8')
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, file)
+            
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """Get setting value.
         
@@ -12,7 +12,7 @@ class SettingsDialog(QDialog):
         self.logger = logging.getLogger(__name__)
         self.logger.debug("Initializing SettingsDialog")
         
-        self.settings = QSettings('NeuroForge', 'IDE')
+        self.settings = QSettings('NeuralForge', 'IDE')
         self.logger.debug("QSettings initialized")
         
         try:
@@ -178,52 +178,60 @@ class SettingsDialog(QDialog):
             self.logger.debug("Starting to load settings")
             
             # Editor settings
-            font_family = self.settings.value('editor/font_family', 'Consolas')
-            self.font_family.setCurrentText(font_family)
-            self.logger.debug(f"Loaded font family: {font_family}")
-            
-            font_size = int(self.settings.value('editor/font_size', 11))
-            self.font_size.setValue(font_size)
-            self.logger.debug(f"Loaded font size: {font_size}")
-            
-            # Color settings
-            bg_color = self.settings.value('editor/background_color', '#2D2D2D')
-            self.bg_color_preview.setStyleSheet(f"background-color: {bg_color}; border: 1px solid gray;")
-            self.logger.debug(f"Loaded background color: {bg_color}")
-            
-            text_color = self.settings.value('editor/text_color', '#FFFFFF')
-            self.text_color_preview.setStyleSheet(f"background-color: {text_color}; border: 1px solid gray;")
-            self.logger.debug(f"Loaded text color: {text_color}")
-            
-            # Editor behavior
-            auto_indent = self.settings.value('editor/auto_indent', True, type=bool)
-            self.auto_indent.setChecked(auto_indent)
-            self.logger.debug(f"Loaded auto indent: {auto_indent}")
-            
-            show_line_numbers = self.settings.value('editor/show_line_numbers', True, type=bool)
-            self.line_numbers.setChecked(show_line_numbers)
-            self.logger.debug(f"Loaded show line numbers: {show_line_numbers}")
-            
-            tab_width = self.settings.value('editor/tab_width', 4, type=int)
-            self.tab_width.setValue(tab_width)
-            self.logger.debug(f"Loaded tab width: {tab_width}")
+            self.settings.beginGroup('editor')
+            try:
+                font_family = self.settings.value('font_family', 'Consolas', type=str)
+                self.font_family.setCurrentText(font_family)
+                self.logger.debug("Loaded font family: %s", font_family)
+                
+                font_size = self.settings.value('font_size', 11, type=int)
+                self.font_size.setValue(font_size)
+                self.logger.debug("Loaded font size: %s", font_size)
+                
+                # Color settings
+                bg_color = self.settings.value('background_color', '#2D2D2D', type=str)
+                self.bg_color_preview.setStyleSheet(f"background-color: {bg_color}; border: 1px solid gray;")
+                self.logger.debug("Loaded background color: %s", bg_color)
+                
+                text_color = self.settings.value('text_color', '#FFFFFF', type=str)
+                self.text_color_preview.setStyleSheet(f"background-color: {text_color}; border: 1px solid gray;")
+                self.logger.debug("Loaded text color: %s", text_color)
+                
+                # Editor behavior
+                auto_indent = self.settings.value('auto_indent', True, type=bool)
+                self.auto_indent.setChecked(auto_indent)
+                self.logger.debug("Loaded auto indent: %s", auto_indent)
+                
+                show_line_numbers = self.settings.value('show_line_numbers', True, type=bool)
+                self.line_numbers.setChecked(show_line_numbers)
+                self.logger.debug("Loaded show line numbers: %s", show_line_numbers)
+                
+                tab_width = self.settings.value('tab_width', 4, type=int)
+                self.tab_width.setValue(tab_width)
+                self.logger.debug("Loaded tab width: %s", tab_width)
+            finally:
+                self.settings.endGroup()
             
             # ML settings
-            default_epochs = int(self.settings.value('ml/default_epochs', 10))
-            self.default_epochs.setValue(default_epochs)
-            self.logger.debug(f"Loaded default epochs: {default_epochs}")
-            
-            default_batch_size = int(self.settings.value('ml/default_batch_size', 32))
-            self.default_batch_size.setValue(default_batch_size)
-            self.logger.debug(f"Loaded default batch size: {default_batch_size}")
-            
-            default_learning_rate = float(self.settings.value('ml/default_learning_rate', 0.001))
-            self.default_learning_rate.setValue(default_learning_rate)
-            self.logger.debug(f"Loaded default learning rate: {default_learning_rate}")
-            
-            default_framework = self.settings.value('ml/default_framework', 'PyTorch')
-            self.default_framework.setCurrentText(default_framework)
-            self.logger.debug(f"Loaded default framework: {default_framework}")
+            self.settings.beginGroup('ml')
+            try:
+                default_epochs = self.settings.value('default_epochs', 10, type=int)
+                self.default_epochs.setValue(default_epochs)
+                self.logger.debug("Loaded default epochs: %s", default_epochs)
+                
+                default_batch_size = self.settings.value('default_batch_size', 32, type=int)
+                self.default_batch_size.setValue(default_batch_size)
+                self.logger.debug("Loaded default batch size: %s", default_batch_size)
+                
+                default_learning_rate = self.settings.value('default_learning_rate', 0.001, type=float)
+                self.default_learning_rate.setValue(default_learning_rate)
+                self.logger.debug("Loaded default learning rate: %s", default_learning_rate)
+                
+                default_framework = self.settings.value('default_framework', 'PyTorch', type=str)
+                self.default_framework.setCurrentText(default_framework)
+                self.logger.debug("Loaded default framework: %s", default_framework)
+            finally:
+                self.settings.endGroup()
             
             self.logger.debug("Settings loaded successfully")
             
@@ -237,52 +245,60 @@ class SettingsDialog(QDialog):
             self.logger.debug("Starting to save settings")
             
             # Editor settings
-            font_family = self.font_family.currentText()
-            self.settings.setValue('editor/font_family', font_family)
-            self.logger.debug(f"Saved font family: {font_family}")
-            
-            font_size = self.font_size.value()
-            self.settings.setValue('editor/font_size', font_size)
-            self.logger.debug(f"Saved font size: {font_size}")
-            
-            # Color settings
-            bg_color = self.bg_color_preview.palette().color(QPalette.ColorRole.Window).name()
-            self.settings.setValue('editor/background_color', bg_color)
-            self.logger.debug(f"Saved background color: {bg_color}")
-            
-            text_color = self.text_color_preview.palette().color(QPalette.ColorRole.Window).name()
-            self.settings.setValue('editor/text_color', text_color)
-            self.logger.debug(f"Saved text color: {text_color}")
-            
-            # Editor behavior
-            auto_indent = self.auto_indent.isChecked()
-            self.settings.setValue('editor/auto_indent', auto_indent)
-            self.logger.debug(f"Saved auto indent: {auto_indent}")
-            
-            show_line_numbers = self.line_numbers.isChecked()
-            self.settings.setValue('editor/show_line_numbers', show_line_numbers)
-            self.logger.debug(f"Saved show line numbers: {show_line_numbers}")
-            
-            tab_width = self.tab_width.value()
-            self.settings.setValue('editor/tab_width', tab_width)
-            self.logger.debug(f"Saved tab width: {tab_width}")
+            self.settings.beginGroup('editor')
+            try:
+                font_family = self.font_family.currentText()
+                self.settings.setValue('font_family', font_family)
+                self.logger.debug("Saved font family: %s", font_family)
+                
+                font_size = self.font_size.value()
+                self.settings.setValue('font_size', font_size)
+                self.logger.debug("Saved font size: %s", font_size)
+                
+                # Color settings
+                bg_color = self.bg_color_preview.palette().color(QPalette.ColorRole.Window).name()
+                self.settings.setValue('background_color', bg_color)
+                self.logger.debug("Saved background color: %s", bg_color)
+                
+                text_color = self.text_color_preview.palette().color(QPalette.ColorRole.Window).name()
+                self.settings.setValue('text_color', text_color)
+                self.logger.debug("Saved text color: %s", text_color)
+                
+                # Editor behavior
+                auto_indent = self.auto_indent.isChecked()
+                self.settings.setValue('auto_indent', auto_indent)
+                self.logger.debug("Saved auto indent: %s", auto_indent)
+                
+                show_line_numbers = self.line_numbers.isChecked()
+                self.settings.setValue('show_line_numbers', show_line_numbers)
+                self.logger.debug("Saved show line numbers: %s", show_line_numbers)
+                
+                tab_width = self.tab_width.value()
+                self.settings.setValue('tab_width', tab_width)
+                self.logger.debug("Saved tab width: %s", tab_width)
+            finally:
+                self.settings.endGroup()
             
             # ML settings
-            default_epochs = self.default_epochs.value()
-            self.settings.setValue('ml/default_epochs', default_epochs)
-            self.logger.debug(f"Saved default epochs: {default_epochs}")
-            
-            default_batch_size = self.default_batch_size.value()
-            self.settings.setValue('ml/default_batch_size', default_batch_size)
-            self.logger.debug(f"Saved default batch size: {default_batch_size}")
-            
-            default_learning_rate = self.default_learning_rate.value()
-            self.settings.setValue('ml/default_learning_rate', default_learning_rate)
-            self.logger.debug(f"Saved default learning rate: {default_learning_rate}")
-            
-            default_framework = self.default_framework.currentText()
-            self.settings.setValue('ml/default_framework', default_framework)
-            self.logger.debug(f"Saved default framework: {default_framework}")
+            self.settings.beginGroup('ml')
+            try:
+                default_epochs = self.default_epochs.value()
+                self.settings.setValue('default_epochs', default_epochs)
+                self.logger.debug("Saved default epochs: %s", default_epochs)
+                
+                default_batch_size = self.default_batch_size.value()
+                self.settings.setValue('default_batch_size', default_batch_size)
+                self.logger.debug("Saved default batch size: %s", default_batch_size)
+                
+                default_learning_rate = self.default_learning_rate.value()
+                self.settings.setValue('default_learning_rate', default_learning_rate)
+                self.logger.debug("Saved default learning rate: %s", default_learning_rate)
+                
+                default_framework = self.default_framework.currentText()
+                self.settings.setValue('default_framework', default_framework)
+                self.logger.debug("Saved default framework: %s", default_framework)
+            finally:
+                self.settings.endGroup()
             
             self.settings.sync()
             self.logger.debug("Settings saved and synced successfully")
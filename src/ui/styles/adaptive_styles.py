@@ -1,8 +1,25 @@
 """Адаптивные стили для компонентов"""
-from typing import Dict
+from typing import Callable, Dict
 from .theme_manager import ThemeManager, ColorRole
+from PyQt6.QtWidgets import QWidget
+import functools
 import logging
 
+def _cached_style(generator: Callable[[ThemeManager], str]) -> Callable[[ThemeManager], str]:
+    """Кэшировать результат генератора стилей по цветам темы"""
+    @functools.wraps(generator)
+    def wrapper(theme: ThemeManager) -> str:
+        if not isinstance(theme, ThemeManager):
+            return generator(theme)  # Генератор сам сообщит об ошибке
+        key = (generator.__name__, theme.theme_key)
+        style = AdaptiveStyles._style_cache.get(key)
+        if style is None:
+            style = generator(theme)
+            if style:  # Пустая строка означает ошибку, не кэшируем
+                AdaptiveStyles._style_cache[key] = style
+        return style
+    return wrapper
+
 class AdaptiveStyles:
     """Генератор адаптивных стилей"""
     
@@ -33,8 +50,8 @@ class AdaptiveStyles:
             if not isinstance(theme, ThemeManager):
                 raise ValueError("Invalid theme manager provided")
                 
-            # Check cache
-            cache_key = hash(str(theme.get_palette()))
+            # Check cache; key on the theme colors, a fresh QPalette never matches
+            cache_key = theme.theme_key
             if cache_key in AdaptiveStyles._style_cache:
                 return AdaptiveStyles._style_cache[cache_key]
             
@@ -228,6 +245,18 @@ class AdaptiveStyles:
         cls._style_cache.clear()
 
     @staticmethod
+    def apply_style(widget: QWidget, style: str) -> None:
+        """Установить стиль виджету, только если он изменился
+        
+        Args:
+            widget: Виджет для стилизации
+            style: Таблица стилей
+        """
+        if widget.styleSheet() != style:
+            widget.setStyleSheet(style)
+
+    @staticmethod
+    @_cached_style
     def get_code_editor_style(theme: ThemeManager) -> str:
         """Стили для редактора кода"""
         try:
@@ -272,6 +301,7 @@ class AdaptiveStyles:
             """
 
     @staticmethod
+    @_cached_style
     def get_project_explorer_style(theme: ThemeManager) -> str:
         """Стили для проводника проекта"""
         try:
@@ -335,6 +365,7 @@ class AdaptiveStyles:
             """
 
     @staticmethod
+    @_cached_style
     def get_performance_monitor_style(theme: ThemeManager) -> str:
         """Стили для монитора производительности"""
         try:
@@ -389,6 +420,7 @@ class AdaptiveStyles:
             """
 
     @staticmethod
+    @_cached_style
     def get_network_visualizer_style(theme: ThemeManager) -> str:
         """Стили для визуализатора нейронной сети"""
         try:
@@ -432,6 +464,7 @@ class AdaptiveStyles:
             """
 
     @staticmethod
+    @_cached_style
     def get_text_style(theme: ThemeManager) -> str:
         """Get style for text components"""
         try:
@@ -464,6 +497,7 @@ class AdaptiveStyles:
             return ""
 
     @staticmethod
+    @_cached_style
     def get_button_style(theme: ThemeManager) -> str:
         """Get style for button components"""
         try:
@@ -517,6 +551,7 @@ class AdaptiveStyles:
             return ""
 
     @staticmethod
+    @_cached_style
     def get_table_style(theme: ThemeManager) -> str:
         """Get style for table components"""
         try:
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import ClassVar, Dict, Tuple
 from .style_enums import ThemeType, StyleClass, ColorScheme
 from .base_styles import BaseStyles
 from .component_styles import (
@@ -10,9 +10,11 @@ from .component_styles import (
 class StyleManager:
     """Менеджер стилей приложения"""
     
+    # Стили, общие для всех экземпляров: (тема, класс стиля) -> CSS
+    _style_cache: ClassVar[Dict[Tuple[ThemeType, StyleClass], str]] = {}
+    
     def __init__(self):
         self._current_theme = ThemeType.DARK
-        self._style_cache: Dict[StyleClass, str] = {}
         
     @property
     def current_theme(self) -> ThemeType:
@@ -20,8 +22,7 @@ class StyleManager:
     
     def set_theme(self, theme: ThemeType) -> None:
         """Установить тему оформления"""
-        self._current_theme = theme
-        self._style_cache.clear()  # Сбрасываем кэш при смене темы
+        self._current_theme = theme  # Кэш хранит стили каждой темы отдельно
         
     def get_base_style(self) -> str:
         """Получить базовые стили"""
@@ -41,21 +42,38 @@ class StyleManager:
     
     def get_component_style(self, style_class: StyleClass) -> str:
         """Получить стиль для конкретного компонента"""
-        if style_class not in self._style_cache:
+        key = (self._current_theme, style_class)
+        style = self._style_cache.get(key)
+        if style is None:
             style = self._generate_component_style(style_class)
-            self._style_cache[style_class] = style
-        return self._style_cache[style_class]
+            self._style_cache[key] = style
+        return style
     
     def _generate_component_style(self, style_class: StyleClass) -> str:
         """Генерация стиля для компонента"""
-        style_map = {
-            StyleClass.MAIN_WINDOW: self.get_base_style(),
-            StyleClass.DOCK_WIDGET: self.get_performance_monitor_style(),
-            StyleClass.TREE_VIEW: self.get_project_explorer_style(),
-            StyleClass.TAB_WIDGET: self.get_editor_style(),
-        }
-        return style_map.get(style_class, "")
+        # Генерируем только запрошенный стиль
+        generator = self._STYLE_GENERATORS.get(style_class)
+        return generator(self) if generator else ""
 
+    # Генераторы стилей по классу компонента
+    _STYLE_GENERATORS = {
+        StyleClass.MAIN_WINDOW: get_base_style,
+        StyleClass.DOCK_WIDGET: get_performance_monitor_style,
+        StyleClass.TREE_VIEW: get_project_explorer_style,
+        StyleClass.TAB_WIDGET: get_editor_style,
+        StyleClass.CODE_EDITOR: get_editor_style,
+    }
+    
+    # Цвета по классу стиля, собираются один раз
+    _COLOR_MAP: ClassVar[Dict[StyleClass, str]] = {
+        StyleClass.EDITOR_BACKGROUND: ColorScheme.EDITOR_BACKGROUND.value,
+        StyleClass.FOREGROUND: ColorScheme.FOREGROUND.value,
+        StyleClass.EDITOR_SELECTION: ColorScheme.EDITOR_SELECTION.value,
+        StyleClass.LINE_NUMBER_BG: ColorScheme.LINE_NUMBER_BG.value,
+        StyleClass.LINE_NUMBER_FG: ColorScheme.LINE_NUMBER_FG.value,
+        StyleClass.EDITOR_CURRENT_LINE: ColorScheme.EDITOR_CURRENT_LINE.value,
+    }
+    
     def get_color(self, color_class: StyleClass) -> str:
         """Get color value for a style class.
         
@@ -65,13 +83,4 @@ class StyleManager:
         Returns:
             str: Color value in hex format
         """
-        color_map = {
-            StyleClass.EDITOR_BACKGROUND: ColorScheme.EDITOR_BACKGROUND.value,
-            StyleClass.FOREGROUND: ColorScheme.FOREGROUND.value,
-            StyleClass.EDITOR_SELECTION: ColorScheme.EDITOR_SELECTION.value,
-            StyleClass.LINE_NUMBER_BG: ColorScheme.LINE_NUMBER_BG.value,
-            StyleClass.LINE_NUMBER_FG: ColorScheme.LINE_NUMBER_FG.value,
-            StyleClass.EDITOR_CURRENT_LINE: ColorScheme.EDITOR_CURRENT_LINE.value,
-        }
-        
-        return color_map.get(color_class, ColorScheme.FOREGROUND.value)
+        return self._COLOR_MAP.get(color_class, ColorScheme.FOREGROUND.value)
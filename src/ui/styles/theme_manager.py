@@ -1,7 +1,7 @@
 """Менеджер тем для адаптивного интерфейса"""
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, Optional, ClassVar
+from typing import Dict, Optional, ClassVar, Tuple
 import json
 import os
 import logging
@@ -199,6 +199,11 @@ class ThemeManager:
         except Exception as e:
             logger.error(f"Error saving custom themes: {str(e)}", exc_info=True)
 
+    @property
+    def theme_key(self) -> Tuple[Tuple[str, str], ...]:
+        """Hashable key identifying the current theme colors"""
+        return tuple(self._current_theme.to_dict().items())
+
     def get_color(self, role: ColorRole) -> str:
         """Get color for specified role"""
         try:
@@ -262,7 +267,7 @@ class ThemeManager:
             with self._cache_lock:
                 self._theme_cache.clear()
                 
-            logger.debug(f"Theme changed to: {theme_type} {custom_name or ''}")
+            logger.debug("Theme changed to: %s %s", theme_type, custom_name or '')
             
         except Exception as e:
             logger.error(f"Error setting theme: {str(e)}", exc_info=True)
@@ -284,7 +289,7 @@ class ThemeManager:
             self._custom_themes[name] = colors
             self._save_custom_themes()
             
-            logger.debug(f"Custom theme added: {name}")
+            logger.debug("Custom theme added: %s", name)
             
         except Exception as e:
             logger.error(f"Error adding custom theme: {str(e)}", exc_info=True)
@@ -304,7 +309,7 @@ class ThemeManager:
                self._settings.value('theme/custom_name') == name:
                 self.set_theme('dark')
                 
-            logger.debug(f"Custom theme removed: {name}")
+            logger.debug("Custom theme removed: %s", name)
             
         except Exception as e:
             logger.error(f"Error removing custom theme: {str(e)}", exc_info=True)
@@ -313,6 +318,12 @@ class ThemeManager:
     def get_palette(self) -> QPalette:
         """Get Qt palette for current theme"""
         try:
+            # Built once per theme; callers get a copy of the cached palette
+            cache_key = ('palette', id(self._current_theme))
+            with self._cache_lock:
+                if cache_key in self._theme_cache:
+                    return QPalette(self._theme_cache[cache_key])
+                    
             palette = QPalette()
             
             # Set window colors
@@ -331,7 +342,10 @@ class ThemeManager:
             palette.setColor(QPalette.ColorRole.Highlight, self.get_qcolor(ColorRole.ACCENT))
             palette.setColor(QPalette.ColorRole.HighlightedText, self.get_qcolor(ColorRole.ON_PRIMARY))
             
-            return palette
+            with self._cache_lock:
+                self._theme_cache[cache_key] = palette
+                
+            return QPalette(palette)
             
         except Exception as e:
             logger.error(f"Error creating palette: {str(e)}", exc_info=True)
@@ -2,11 +2,14 @@
 from PyQt6.QtGui import QIcon
 from PyQt6.QtCore import QSize
 import os
-from typing import Dict, Optional
+from typing import ClassVar, Dict, Optional
 
 class FileIconManager:
     """Manager for file icons based on programming languages."""
     
+    # Icons shared by all instances, keyed by icon file path
+    _ICON_CACHE: ClassVar[Dict[str, Optional[QIcon]]] = {}
+    
     def __init__(self):
         self.icons_path = os.path.join(
             os.path.dirname(os.path.dirname(__file__)),
@@ -113,15 +116,28 @@ class FileIconManager:
         
         # Load icons for each language
         for ext, lang in self.extension_map.items():
-            icon_path = os.path.join(self.icons_path, f"{lang}.svg")
-            if os.path.exists(icon_path):
-                icon = QIcon(icon_path)
+            icon = self._load_icon(f"{lang}.svg")
+            if icon is not None:
                 self.extension_to_icon[ext] = icon
                 self.language_to_icon[lang] = icon
                 
         # Default icon for unknown file types
-        default_icon_path = os.path.join(self.icons_path, "unknown.svg")
-        self.default_icon = QIcon(default_icon_path) if os.path.exists(default_icon_path) else None
+        self.default_icon = self._load_icon("unknown.svg")
+        
+    def _load_icon(self, icon_name: str) -> Optional[QIcon]:
+        """Load an icon, reusing the instance shared by all managers.
+        
+        Args:
+            icon_name: Icon file name inside the language icons directory
+            
+        Returns:
+            QIcon or None if the icon file does not exist
+        """
+        icon_path = os.path.join(self.icons_path, icon_name)
+        cache = FileIconManager._ICON_CACHE
+        if icon_path not in cache:
+            cache[icon_path] = QIcon(icon_path) if os.path.exists(icon_path) else None
+        return cache[icon_path]
         
     def get_icon_for_file(self, filepath: str, size: QSize = QSize(16, 16)) -> Optional[QIcon]:
         """Get the appropriate icon for a file.
@@ -1,4 +1,5 @@
 from pathlib import Path
+import shutil
 import subprocess
 from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
@@ -9,6 +10,9 @@ from datetime import datetime
 import git
 from git import Repo, GitCommandError, InvalidGitRepositoryError, NoSuchPathError
 
+# Resolve the git binary once instead of searching PATH on every spawn
+GIT_EXECUTABLE = shutil.which('git') or 'git'
+
 class FileStatus(Enum):
     """Git file status types."""
     UNMODIFIED = ' '
@@ -75,6 +79,8 @@ class GitManager(QObject):
             raise RuntimeError("GitManager must be created in the main thread")
         
         self.project_path = Path(project_path)
+        # Subprocess working directory, stringified once
+        self._cwd = str(self.project_path)
         self.logger = logging.getLogger(__name__)
         self._repo: Optional[Repo] = None
         
@@ -189,8 +195,8 @@ class GitManager(QObject):
         
         try:
             process = subprocess.Popen(
-                ['git'] + list(args),
-                cwd=str(self.project_path),
+                [GIT_EXECUTABLE] + list(args),
+                cwd=self._cwd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True
@@ -486,7 +492,7 @@ class GitManager(QObject):
                 cmd.extend(['--branch', branch])
                 
             result = subprocess.run(
-                ['git'] + cmd,
+                [GIT_EXECUTABLE] + cmd,
                 cwd=self.project_path.parent if directory else self.project_path,
                 capture_output=True,
                 text=True,
@@ -72,6 +72,24 @@ class ModuleProxy:
             self._module = importlib.import_module(self._module_name)
         return getattr(self._module, name)
 
+def preload_modules(*proxies: ModuleProxy) -> None:
+    """Import the modules behind lazy proxies ahead of first use.
+    
+    Safe to call from a worker thread; import locks serialize it with
+    any import the GUI thread starts meanwhile. Failures are logged and
+    left for the first real access to raise.
+    
+    Args:
+        *proxies: Proxies returned by lazy_import
+    """
+    for proxy in proxies:
+        if proxy._module is not None:
+            continue
+        try:
+            proxy._module = importlib.import_module(proxy._module_name)
+        except Exception as e:
+            logger.warning("Failed to preload %s: %s", proxy._module_name, e)
+
 class LoadPriority(Enum):
     """Component load priorities."""
     CRITICAL = 0    # Load immediately
@@ -330,7 +348,9 @@ class ComponentLoader:
         self.resource_manager = ResourceManager()
         self.preload_manager = PreloadManager(self.resource_manager)
         self._components: Dict[str, ComponentMetadata] = {}
-        self._lock = threading.Lock()
+        # Reentrant: loading resolves dependencies and factories may
+        # look up other components while the lock is held
+        self._lock = threading.RLock()
         
         # Start preload manager
         self.preload_manager.start()
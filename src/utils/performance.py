@@ -1,6 +1,6 @@
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, Set
 from functools import lru_cache
-from PyQt6.QtCore import QThread, pyqtSignal, QObject, QTimer
+from PyQt6.QtCore import QThread, QThreadPool, QRunnable, pyqtSignal, QObject, QTimer
 from pathlib import Path
 import time
 import psutil
@@ -159,6 +159,51 @@ class AsyncWorker(QThread):
         except:
             pass
 
+class WorkerSignals(QObject):
+    """Signals of a PooledWorker.
+    
+    Signals:
+        finished(result): Emitted with the result when work is complete
+        error(exception): Emitted when an error occurs
+    """
+    finished = pyqtSignal(object)
+    error = pyqtSignal(Exception)
+
+class PooledWorker(QRunnable):
+    """Short task run on the global QThreadPool.
+    
+    Unlike AsyncWorker, no thread is created per task; pool threads are
+    reused. Connect to the worker's signals before calling start; the pool
+    takes ownership of the worker once it is started.
+    """
+    
+    def __init__(self, func: Callable[..., T], *args, **kwargs):
+        """Initialize worker with function and arguments.
+        
+        Args:
+            func: Function to run on a pool thread
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        """
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        
+    def start(self):
+        """Queue the worker on the global thread pool."""
+        QThreadPool.globalInstance().start(self)
+        
+    def run(self):
+        """Execute the worker function on a pool thread."""
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
 class FileSystemCache:
     """Cache for file system operations with TTL and size limits."""
     
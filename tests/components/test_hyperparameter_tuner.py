@@ -0,0 +1,45 @@
+"""Tests for hyperparameter tuner components."""
+from PyQt6.QtCore import Qt
+from src.ui.components.ml.advanced_hyperparameter_tuner import (
+    AdvancedHyperparameterTuner, TrialResultsModel
+)
+
+PARAMS = {'learning_rate': 0.001, 'batch_size': 32, 'dropout_rate': 0.25}
+
+def test_trial_results_append(qtbot):
+    """Test appended trials are shown as formatted rows."""
+    model = TrialResultsModel()
+    model.append(1, 0.5, PARAMS)
+    
+    assert model.rowCount() == 1
+    assert model.columnCount() == 5
+    row = [model.data(model.index(0, column)) for column in range(5)]
+    assert row == ["1", "0.500000", "0.001000", "32", "0.25"]
+    assert model.headerData(0, Qt.Orientation.Horizontal) == "Trial"
+
+def test_trial_results_grow_and_clear(qtbot):
+    """Test the storage grows past one chunk and clears."""
+    model = TrialResultsModel()
+    for trial in range(TrialResultsModel.GROW_ROWS + 1):
+        model.append(trial, float(trial), PARAMS)
+        
+    assert model.rowCount() == TrialResultsModel.GROW_ROWS + 1
+    assert model.data(model.index(TrialResultsModel.GROW_ROWS, 0)) == str(TrialResultsModel.GROW_ROWS)
+    
+    model.clear()
+    assert model.rowCount() == 0
+
+def test_cleanup_stops_running_study(qtbot):
+    """Test cleanup stops the tuning thread and waits for it."""
+    tuner = AdvancedHyperparameterTuner()
+    qtbot.addWidget(tuner)
+    tuner.trials_spin.setValue(1000)
+    
+    tuner._start_tuning()
+    worker = tuner._worker
+    assert worker is not None
+    
+    tuner.cleanup()
+    assert tuner._worker is None
+    assert worker.isFinished()
+    assert tuner.start_btn.isEnabled()
@@ -0,0 +1,22 @@
+"""Tests for ML workspace state."""
+import pytest
+from src.ui.ml_workspace.workspace import MLWorkspace
+
+@pytest.fixture
+def ml_workspace(qtbot):
+    """Create ML workspace fixture."""
+    workspace = MLWorkspace()
+    qtbot.addWidget(workspace)
+    return workspace
+
+def test_workspace_state_follows_changes(ml_workspace):
+    """Test the workspace state is reused until it changes."""
+    state = ml_workspace.get_workspace_state()
+    assert ml_workspace.get_workspace_state() is state
+    assert not state["training"]
+    
+    ml_workspace.model_loaded.emit("resnet")
+    ml_workspace.training_started.emit()
+    state = ml_workspace.get_workspace_state()
+    assert state["model"] == "resnet"
+    assert state["training"]
@@ -0,0 +1,263 @@
+"""Tests for tab manager component."""
+import os
+import pytest
+from PyQt6.QtWidgets import QMessageBox
+from src.ui.components.tab_manager import TabManager
+
+@pytest.fixture
+def tab_manager(qtbot):
+    """Create tab manager fixture."""
+    manager = TabManager()
+    qtbot.addWidget(manager)
+    return manager
+
+@pytest.fixture
+def source_file(tmp_path):
+    """Create a source file to open."""
+    path = tmp_path / "example.py"
+    path.write_text("print('hello')\n", encoding="utf-8")
+    return path
+
+def wait_loaded(qtbot, editor):
+    """Wait until the worker has filled an editor."""
+    qtbot.waitUntil(lambda: not editor.isReadOnly(), timeout=5000)
+
+def test_open_file(qtbot, tab_manager, source_file):
+    """Test opening a file loads it into a new tab."""
+    editor = tab_manager.open_file(source_file)
+    wait_loaded(qtbot, editor)
+    
+    assert tab_manager.count() == 1
+    assert editor.toPlainText() == "print('hello')\n"
+    assert not editor.document().isModified()
+    assert editor.file_key in tab_manager.open_files
+
+def test_open_large_file(qtbot, tab_manager, tmp_path):
+    """Test a file spanning several insert batches loads completely."""
+    path = tmp_path / "large.txt"
+    content = "".join(f"line {i}\n" for i in range(200000))
+    path.write_text(content, encoding="utf-8")
+    
+    editor = tab_manager.open_file(path)
+    wait_loaded(qtbot, editor)
+    
+    assert editor.toPlainText() == content
+    assert not editor.document().isModified()
+    assert editor.isUndoRedoEnabled()
+
+def test_open_file_twice_reuses_tab(qtbot, tab_manager, source_file):
+    """Test opening an already open file returns its editor."""
+    editor = tab_manager.open_file(source_file)
+    assert tab_manager.open_file(source_file) is editor
+    assert tab_manager.count() == 1
+
+def test_open_file_alias_reuses_tab(qtbot, tab_manager, source_file):
+    """Test a different spelling of an open path reuses its tab."""
+    editor = tab_manager.open_file(source_file)
+    alias = source_file.parent / "sub" / ".." / source_file.name
+    (source_file.parent / "sub").mkdir()
+    
+    assert tab_manager.open_file(alias) is editor
+    assert tab_manager.count() == 1
+
+def test_close_tab(qtbot, tab_manager, source_file):
+    """Test closing a tab forgets the file."""
+    editor = tab_manager.open_file(source_file)
+    wait_loaded(qtbot, editor)
+    
+    assert tab_manager.close_tab(0)
+    assert tab_manager.count() == 0
+    assert editor.file_key not in tab_manager.open_files
+
+def test_close_all_tabs(qtbot, tab_manager, tmp_path):
+    """Test closing all tabs forgets every file."""
+    editors = []
+    for i in range(6):
+        path = tmp_path / f"file_{i}.py"
+        path.write_text("", encoding="utf-8")
+        editors.append(tab_manager.open_file(path))
+        
+    assert tab_manager.close_all_tabs()
+    assert tab_manager.count() == 0
+    assert not tab_manager.open_files
+    qtbot.waitUntil(lambda: not tab_manager._pending_destroy, timeout=5000)
+
+def test_close_all_tabs_saves_modified(qtbot, tab_manager, source_file, monkeypatch):
+    """Test unsaved files are saved after a single prompt."""
+    prompts = []
+    
+    def answer(*args):
+        prompts.append(args)
+        return QMessageBox.StandardButton.SaveAll
+        
+    monkeypatch.setattr(QMessageBox, "question", answer)
+    editor = tab_manager.open_file(source_file)
+    wait_loaded(qtbot, editor)
+    editor.insertPlainText("# saved\n")
+    
+    assert tab_manager.close_all_tabs()
+    assert len(prompts) == 1
+    # The tab stays open until its save has been written
+    assert tab_manager.count() == 1
+    qtbot.waitUntil(lambda: tab_manager.count() == 0, timeout=5000)
+    assert source_file.read_text(encoding="utf-8").startswith("# saved\n")
+
+def test_close_all_tabs_keeps_failed_save(qtbot, tab_manager, source_file, monkeypatch):
+    """Test a file that fails to save keeps its tab and shows a warning."""
+    warnings = []
+    
+    def fail(*args):
+        raise OSError("disk full")
+        
+    monkeypatch.setattr(
+        QMessageBox, "question", lambda *args: QMessageBox.StandardButton.SaveAll
+    )
+    monkeypatch.setattr(QMessageBox, "warning", lambda *args: warnings.append(args))
+    monkeypatch.setattr(TabManager, "_write_file", staticmethod(fail))
+    editor = tab_manager.open_file(source_file)
+    wait_loaded(qtbot, editor)
+    editor.insertPlainText("# unsaved\n")
+    
+    tab_manager.close_all_tabs()
+    qtbot.waitUntil(lambda: bool(warnings), timeout=5000)
+    
+    assert tab_manager.count() == 1
+    assert editor.document().isModified()
+
+def test_close_all_tabs_cancel(qtbot, tab_manager, source_file, monkeypatch):
+    """Test cancelling the prompt keeps every tab open."""
+    monkeypatch.setattr(
+        QMessageBox, "question", lambda *args: QMessageBox.StandardButton.Cancel
+    )
+    editor = tab_manager.open_file(source_file)
+    wait_loaded(qtbot, editor)
+    editor.insertPlainText("# unsaved\n")
+    
+    assert not tab_manager.close_all_tabs()
+    assert tab_manager.count() == 1
+
+def test_reopen_closed_file(qtbot, tab_manager, source_file):
+    """Test reopening a closed, unchanged file reuses its content."""
+    editor = tab_manager.open_file(source_file)
+    wait_loaded(qtbot, editor)
+    tab_manager.close_tab(0)
+    
+    reopened = tab_manager.open_file(source_file)
+    
+    # Filled without a worker round trip
+    assert not reopened.isReadOnly()
+    assert reopened.toPlainText() == "print('hello')\n"
+    assert not reopened.document().isModified()
+
+def test_reopen_file_changed_after_close(qtbot, tab_manager, source_file):
+    """Test a file changed on disk after closing is read again."""
+    editor = tab_manager.open_file(source_file)
+    wait_loaded(qtbot, editor)
+    tab_manager.close_tab(0)
+    
+    source_file.write_text("print('changed')\n", encoding="utf-8")
+    os.utime(source_file, ns=(0, source_file.stat().st_mtime_ns + 10**9))
+    
+    reopened = tab_manager.open_file(source_file)
+    wait_loaded(qtbot, reopened)
+    assert reopened.toPlainText() == "print('changed')\n"
+
+def test_save_all_files(qtbot, tab_manager, tmp_path):
+    """Test saving all modified editors."""
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"file_{i}.py"
+        path.write_text("", encoding="utf-8")
+        paths.append(path)
+        
+    editors = [tab_manager.open_file(path) for path in paths]
+    for i, editor in enumerate(editors):
+        wait_loaded(qtbot, editor)
+        editor.insertPlainText(f"value = {i}\n")
+        
+    assert tab_manager.save_all_files() == len(editors)
+    qtbot.waitUntil(
+        lambda: not any(e.document().isModified() for e in editors),
+        timeout=5000
+    )
+    
+    for i, path in enumerate(paths):
+        assert path.read_text(encoding="utf-8") == f"value = {i}\n"
+
+def test_save_during_save_writes_latest(qtbot, tab_manager, source_file):
+    """Test a save requested while the file is being written runs afterwards."""
+    editor = tab_manager.open_file(source_file)
+    wait_loaded(qtbot, editor)
+    
+    editor.insertPlainText("# first\n")
+    assert tab_manager.save_current_file()
+    editor.insertPlainText("# second\n")
+    assert tab_manager.save_current_file()
+    # The second save waits for the first instead of racing it
+    assert len(tab_manager._saving) == 1
+    
+    qtbot.waitUntil(
+        lambda: not tab_manager._saving and not tab_manager._save_queue,
+        timeout=5000
+    )
+    assert source_file.read_text(encoding="utf-8") == editor.toPlainText()
+
+def test_save_unchanged_file_skips_write(qtbot, tab_manager, source_file):
+    """Test saving unchanged content leaves the file untouched."""
+    editor = tab_manager.open_file(source_file)
+    wait_loaded(qtbot, editor)
+    mtime = source_file.stat().st_mtime_ns
+    
+    assert tab_manager.save_current_file()
+    qtbot.waitUntil(lambda: not tab_manager._saving, timeout=5000)
+    
+    assert source_file.stat().st_mtime_ns == mtime
+
+def test_save_while_loading_is_refused(qtbot, tab_manager, tmp_path):
+    """Test a file still being loaded is neither saved nor counted as modified."""
+    path = tmp_path / "large.txt"
+    content = "".join(f"line {i}\n" for i in range(200000))
+    path.write_text(content, encoding="utf-8")
+    
+    editor = tab_manager.open_file(path)
+    assert not tab_manager.save_current_file()
+    assert tab_manager.save_all_files() == 0
+    
+    wait_loaded(qtbot, editor)
+    assert path.read_text(encoding="utf-8") == content
+
+def test_open_crlf_file(qtbot, tab_manager, tmp_path):
+    """Test CRLF newlines split across reads load as single line breaks."""
+    path = tmp_path / "crlf.txt"
+    path.write_bytes(b"line\r\n" * 50000)
+    mtime = path.stat().st_mtime_ns
+    
+    editor = tab_manager.open_file(path)
+    wait_loaded(qtbot, editor)
+    assert editor.toPlainText() == "line\n" * 50000
+    
+    # Unchanged content hashes the same as the normalized text on disk
+    assert tab_manager.save_current_file()
+    qtbot.waitUntil(lambda: not tab_manager._saving, timeout=5000)
+    assert path.stat().st_mtime_ns == mtime
+
+def test_close_button_prompts_for_unsaved_changes(qtbot, tab_manager, source_file, monkeypatch):
+    """Test the tab close button keeps a modified tab when cancelled."""
+    editor = tab_manager.open_file(source_file)
+    wait_loaded(qtbot, editor)
+    editor.insertPlainText("# edited\n")
+    
+    monkeypatch.setattr(
+        QMessageBox, "question",
+        lambda *args: QMessageBox.StandardButton.Cancel
+    )
+    tab_manager.tabCloseRequested.emit(0)
+    assert tab_manager.count() == 1
+    
+    monkeypatch.setattr(
+        QMessageBox, "question",
+        lambda *args: QMessageBox.StandardButton.Save
+    )
+    tab_manager.tabCloseRequested.emit(0)
+    qtbot.waitUntil(lambda: tab_manager.count() == 0, timeout=5000)
+    assert source_file.read_text(encoding="utf-8") == "# edited\nprint('hello')\n"
@@ -2,7 +2,7 @@ import pytest
 from PyQt6.QtCore import QThread, Qt, QTimer, QEventLoop
 from PyQt6.QtWidgets import QApplication
 import time
-from src.utils.performance import AsyncWorker
+from src.utils.performance import AsyncWorker, PooledWorker
 import logging
 import sys
 from weakref import ref
@@ -771,3 +771,24 @@ def test_error_handling_with_progress(qtbot, qapp):
     finally:
         worker.cleanup()
         qapp.processEvents()
+
+@pytest.mark.qt
+def test_pooled_worker_result(qtbot, qapp):
+    """Test pooled worker emits its result"""
+    worker = PooledWorker(_helper_function_with_args, 5, 3)
+    
+    with qtbot.waitSignal(worker.signals.finished, timeout=3000) as blocker:
+        worker.start()
+        
+    assert blocker.args == [15]
+
+@pytest.mark.qt
+def test_pooled_worker_error(qtbot, qapp):
+    """Test pooled worker emits raised errors"""
+    worker = PooledWorker(_helper_error_function)
+    
+    with qtbot.waitSignal(worker.signals.error, timeout=3000) as blocker:
+        worker.start()
+        
+    assert isinstance(blocker.args[0], ValueError)
+    assert str(blocker.args[0]) == "test error"
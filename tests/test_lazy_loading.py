@@ -11,7 +11,7 @@ from PyQt6.QtCore import QTimer, Qt, QEvent
 
 from src.utils.lazy_loading import (
     LazyLoader, LazyWidget, lazy_property,
-    ComponentLoader, ModuleProxy, lazy_import,
+    ComponentLoader, ModuleProxy, lazy_import, preload_modules,
     LoadPriority,
     ComponentMetadata,
     ResourceManager,
@@ -426,6 +426,54 @@ def test_lazy_import():
     
     logger.info("Completed test_lazy_import")
 
+def test_preload_modules():
+    """Test preloading lazy imports on a worker thread"""
+    json = lazy_import("json")
+    missing = lazy_import("nonexistent_module")
+    
+    worker = threading.Thread(target=preload_modules, args=(json, missing))
+    worker.start()
+    worker.join()
+    
+    # Loaded module is kept, failure is left for the first access
+    assert json._module is not None
+    assert missing._module is None
+    with pytest.raises(ImportError):
+        missing.anything
+
+def test_component_dependencies_resolve_once(component_loader):
+    """Test loading a component with dependencies, then reusing it"""
+    class Component:
+        pass
+        
+    created = []
+    
+    def factory(name):
+        def create():
+            created.append(name)
+            return Component()
+        return create
+        
+    component_loader.register_component("base", factory("base"))
+    component_loader.register_component(
+        "child", factory("child"), dependencies={"base"}
+    )
+    
+    result = []
+    worker = threading.Thread(
+        target=lambda: result.append(component_loader.get_component("child"))
+    )
+    worker.start()
+    worker.join(timeout=5)
+    
+    # Resolving a dependency must not deadlock on the loader lock
+    assert not worker.is_alive()
+    assert created == ["base", "child"]
+    
+    # Repeated lookups return the loaded instance
+    assert component_loader.get_component("child") is result[0]
+    assert created == ["base", "child"]
+
 def test_thread_safety():
     """Тест потокобезопасности загрузки модулей"""
     logger.info("Starting test_thread_safety")
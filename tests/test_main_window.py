@@ -287,6 +287,49 @@ def test_dock_manager_lazy(main_window):
     main_window.dock_manager.toggle_dock("output")
     assert not dock.isVisible()
 
+def test_view_action_sets_dock_visibility(main_window):
+    """Test view menu toggles follow their checked state."""
+    dock = main_window.dock_manager.get_dock("output")
+    action = main_window.menu_manager.get_action("view", "toggle_output")
+    
+    action.trigger()
+    assert not action.isChecked()
+    assert not dock.isVisible()
+    
+    action.trigger()
+    assert action.isChecked()
+    assert dock.isVisible()
+
+def test_view_action_follows_dock_close(main_window):
+    """Test closing a dock directly unchecks its view toggle."""
+    dock = main_window.dock_manager.get_dock("output")
+    action = main_window.menu_manager.get_action("view", "toggle_output")
+    
+    dock.close()
+    assert not action.isChecked()
+    
+    # A single click brings it back
+    action.trigger()
+    assert dock.isVisible()
+
+def test_status_line_follows_encoding(qtbot, main_window):
+    """Test the status line shows the editor's encoding."""
+    qtbot.waitUntil(lambda: hasattr(main_window, "status_line"), timeout=5000)
+    
+    main_window.code_editor.encoding_changed.emit("latin-1")
+    assert "latin-1" in main_window.status_line._text()
+
+def test_run_action_without_file(main_window):
+    """Test the run action reports when there is no file to run."""
+    action = main_window.menu_manager.get_action("run", "run")
+    assert action is not None
+    assert not action.icon().isNull()
+    
+    main_window.code_editor.file_path = None
+    action.trigger()
+    assert main_window._run_process is None
+    assert main_window.statusBar().currentMessage() == "No file to run"
+
 def test_menu_manager_lazy(main_window):
     """Test menu manager functionality with lazy loading."""
     # Check menu manager initialization